@@ -0,0 +1,124 @@
+import argparse
+import json
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, ROOT)
+
+import nexus_core as core
+
+# ────────────────────────────────────────────────────────────────
+# TAXONOMY EVAL – throughput and agreement on hand-labeled articles
+#   python benchmarks/eval_taxonomy.py
+#   python benchmarks/eval_taxonomy.py --taxonomy my.json --min-accuracy 0.9
+# Each fixture line: title, source, optional summary / declared category,
+# and `labels` with the expected primary category first.
+# ────────────────────────────────────────────────────────────────
+def legacy_categorize(item):
+    """The keyword chain the taxonomy replaced, for comparison."""
+    title_lower = item["title"].lower()
+    if any(kw in title_lower for kw in ["telecom", "5g", "bss", "oss", "netcracker", "amdocs"]):
+        return "telco"
+    if any(kw in title_lower for kw in ["ott", "streaming", "vod", "sony"]):
+        return "ott"
+    return "technology"
+
+def load_fixtures(path):
+    with open(path, encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+def per_category(expected, predicted, categories):
+    report = {}
+    for cat in categories:
+        tp = sum(1 for e, p in zip(expected, predicted) if e == cat and p == cat)
+        fp = sum(1 for e, p in zip(expected, predicted) if e != cat and p == cat)
+        fn = sum(1 for e, p in zip(expected, predicted) if e == cat and p != cat)
+        report[cat] = {
+            "support": tp + fn,
+            "precision": round(tp / (tp + fp), 3) if tp + fp else None,
+            "recall": round(tp / (tp + fn), 3) if tp + fn else None,
+        }
+    return report
+
+def evaluate(taxonomy, fixtures, repeat):
+    expected = [f["labels"][0] for f in fixtures]
+    results = taxonomy.classify(fixtures)
+    predicted = [primary for primary, _ in results]
+    legacy = [legacy_categorize(f) for f in fixtures]
+
+    # Multi-label: predicted label set vs. expected label set, micro-averaged
+    hits = sum(len(set(f["labels"]) & set(labels)) for f, (_, labels) in zip(fixtures, results))
+    n_predicted = sum(len(labels) for _, labels in results)
+    n_expected = sum(len(f["labels"]) for f in fixtures)
+
+    batch = fixtures * max(1, 10000 // len(fixtures))
+    best = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        taxonomy.classify(batch)
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+
+    mistakes = [
+        {"title": f["title"], "source": f["source"], "expected": f["labels"], "primary": primary, "scores": labels}
+        for f, (primary, labels) in zip(fixtures, results) if primary != f["labels"][0]
+    ]
+    return {
+        "fixtures": len(fixtures),
+        "terms": len(taxonomy.terms),
+        "throughput": {"articles": len(batch), "seconds": round(best, 6),
+                       "articles_per_s": round(len(batch) / best), "us_per_article": round(best / len(batch) * 1e6, 3)},
+        "accuracy": round(sum(e == p for e, p in zip(expected, predicted)) / len(fixtures), 3),
+        "legacy_accuracy": round(sum(e == p for e, p in zip(expected, legacy)) / len(fixtures), 3),
+        "labels": {"precision": round(hits / n_predicted, 3), "recall": round(hits / n_expected, 3),
+                   "exact": round(sum(set(f["labels"]) == set(labels) for f, (_, labels) in zip(fixtures, results)) / len(fixtures), 3)},
+        "categories": per_category(expected, predicted, taxonomy.categories),
+        "legacy_categories": per_category(expected, legacy, taxonomy.categories),
+        "mistakes": mistakes,
+    }
+
+def print_report(report, compile_s):
+    t = report["throughput"]
+    print(f"taxonomy: {report['terms']} terms compiled in {compile_s * 1000:.1f} ms")
+    print(f"throughput: {t['articles_per_s']:,} articles/s ({t['us_per_article']} us/article, batch of {t['articles']})")
+    print(f"primary accuracy: {report['accuracy']:.1%} on {report['fixtures']} fixtures (legacy chain: {report['legacy_accuracy']:.1%})")
+    labels = report["labels"]
+    print(f"labels: precision {labels['precision']:.1%}, recall {labels['recall']:.1%}, exact set {labels['exact']:.1%}")
+    print(f"\n{'category':<12}{'support':>8}{'precision':>11}{'recall':>8}{'legacy p':>10}{'legacy r':>10}")
+    fmt = lambda v: "-" if v is None else f"{v:.2f}"
+    for cat, row in report["categories"].items():
+        old = report["legacy_categories"][cat]
+        print(f"{cat:<12}{row['support']:>8}{fmt(row['precision']):>11}{fmt(row['recall']):>8}"
+              f"{fmt(old['precision']):>10}{fmt(old['recall']):>10}")
+    if report["mistakes"]:
+        print("\nmisclassified:")
+        for m in report["mistakes"]:
+            print(f"  [{m['expected'][0]} -> {m['primary']}] {m['title']} ({m['source']}) {m['scores']}")
+
+def main():
+    parser = argparse.ArgumentParser(description="Score the taxonomy classifier against labeled fixture articles.")
+    parser.add_argument("--taxonomy", default=core.TAXONOMY_PATH, help="taxonomy config (default: $NEXUS_TAXONOMY or taxonomy.json)")
+    parser.add_argument("--fixtures", default=os.path.join(HERE, "taxonomy_fixtures.jsonl"))
+    parser.add_argument("--repeat", type=int, default=5, help="timing runs; the best one is reported")
+    parser.add_argument("--json", action="store_true", help="print the full report as JSON")
+    parser.add_argument("--min-accuracy", type=float, help="exit 1 if primary accuracy falls below this")
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    taxonomy = core.Taxonomy.load(args.taxonomy)
+    compile_s = time.perf_counter() - started
+    report = evaluate(taxonomy, load_fixtures(args.fixtures), args.repeat)
+    report["compile_s"] = round(compile_s, 6)
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print_report(report, compile_s)
+    if args.min_accuracy is not None and report["accuracy"] < args.min_accuracy:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,208 @@
+import argparse
+import functools
+import hashlib
+import json
+import random
+import sys
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit, parse_qs
+from xml.sax.saxutils import escape
+
+# ────────────────────────────────────────────────────────────────
+# LOCAL STAND-IN FOR PUBLISHER FEEDS + NEWSAPI
+#   /feed/<name>.xml?entries=20&body=2000&format=rss|atom
+#   /v2/everything?q=...&pageSize=100&page=1
+# Documents are generated from a seed, so every run sees the same bytes.
+# ────────────────────────────────────────────────────────────────
+SUBJECTS = [
+    "Amdocs", "Netcracker", "Ericsson", "Nokia", "Astro", "AT&T", "FOX Sports", "Sky NZ", "BBC",
+    "Telekom Malaysia", "Vodafone", "Orange", "Comcast", "Netflix", "Disney", "Huawei", "CSG", "Optiva",
+]
+VERBS = [
+    "signs partnership with", "acquires stake in", "launches 5G streaming bundle with",
+    "expands BSS deal with", "wins OSS contract from", "teams up with", "completes merger with",
+    "rolls out VoD platform for", "renews billing agreement with", "unveils AI churn tools for",
+]
+OBJECTS = [
+    "regional operator", "OTT platform", "sports streamer", "cable network", "cloud provider",
+    "satellite broadcaster", "fintech startup", "mobile carrier", "media group", "telecom regulator",
+]
+
+def headline(rng, index):
+    return f"{rng.choice(SUBJECTS)} {rng.choice(VERBS)} {rng.choice(OBJECTS)} in {rng.choice(['Asia', 'Europe', 'the US', 'MENA', 'LatAm'])} (#{index})"
+
+@functools.lru_cache(maxsize=512)
+def render_feed(name, entries, body_bytes, fmt, malformed=False):
+    now = datetime.now(timezone.utc).replace(minute=0, second=0, microsecond=0)
+    rng = random.Random(f"{name}:{entries}:{body_bytes}")
+    filler = escape(("<p>" + "lorem ipsum dolor sit amet " * 8 + "</p>") * (body_bytes // 250 + 1))[:body_bytes]
+    parts = []
+    for i in range(entries):
+        title = escape(headline(rng, i))
+        link = f"https://{name}.example.com/{i}?utm_source=rss"
+        pub = now - timedelta(hours=i * 3)
+        if fmt == "atom":
+            parts.append(
+                f'<entry><title>{title}</title><link rel="alternate" href="{link}"/><id>tag:{name},{i}</id>'
+                f"<updated>{pub.isoformat()}</updated><content type=\"html\">{filler}</content></entry>"
+            )
+        else:
+            parts.append(
+                f"<item><title>{title}</title><link>{link}</link><guid>{name}-{i}</guid>"
+                f"<pubDate>{format_datetime(pub)}</pubDate><description>{filler}</description></item>"
+            )
+    if fmt == "atom":
+        doc = f'<?xml version="1.0"?><feed xmlns="http://www.w3.org/2005/Atom"><title>{name}</title>{"".join(parts)}</feed>'
+    else:
+        doc = f'<?xml version="1.0"?><rss version="2.0"><channel><title>{name}</title>{"".join(parts)}</channel></rss>'
+    if malformed:
+        doc = doc.replace("</title>", "&nbsp;</title>", 3)   # undeclared entity: forces the feedparser fallback
+    return doc.encode()
+
+def render_newsapi(query, page, page_size, total):
+    rng = random.Random(f"{query}:{page}")
+    now = datetime.now(timezone.utc)
+    start = (page - 1) * page_size
+    articles = []
+    for i in range(start, min(start + page_size, total)):
+        articles.append({
+            "source": {"id": None, "name": f"Wire {i % 7}"},
+            "title": headline(rng, i),
+            "description": "Deal terms were not disclosed. " * 3,
+            "url": f"https://wire{i % 7}.example.com/{hashlib.md5(query.encode()).hexdigest()[:8]}/{i}",
+            "publishedAt": (now - timedelta(minutes=i * 17)).strftime("%Y-%m-%dT%H:%M:%SZ"),
+        })
+    return json.dumps({"status": "ok", "totalResults": total, "articles": articles}).encode()
+
+class FixtureConfig:
+    def __init__(self, latency=0.02, jitter=0.0, failure_rate=0.0, malformed_rate=0.0,
+                 stall_rate=0.0, stall_seconds=30.0, newsapi_total=150, seed=7):
+        self.latency = latency
+        self.jitter = jitter
+        self.failure_rate = failure_rate
+        self.malformed_rate = malformed_rate
+        self.stall_rate = stall_rate
+        self.stall_seconds = stall_seconds
+        self.newsapi_total = newsapi_total
+        self.rng = random.Random(seed)
+        self.lock = threading.Lock()
+
+    def roll(self, rate):
+        with self.lock:
+            return self.rng.random() < rate
+
+class FixtureHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    config = FixtureConfig()
+    stats = {"requests": 0, "bytes": 0, "not_modified": 0, "failed": 0}
+
+    def do_GET(self):
+        cfg = self.config
+        parts = urlsplit(self.path)
+        query = {k: v[-1] for k, v in parse_qs(parts.query).items()}
+        if parts.path == "/_stats":
+            return self._send(200, json.dumps(self.stats).encode(), "application/json")
+
+        self.stats["requests"] += 1
+        time.sleep(max(0.0, cfg.latency + (cfg.rng.uniform(-cfg.jitter, cfg.jitter) if cfg.jitter else 0)))
+        if cfg.roll(cfg.stall_rate):
+            time.sleep(cfg.stall_seconds)
+        if cfg.roll(cfg.failure_rate):
+            self.stats["failed"] += 1
+            return self._send(500, b"injected failure", "text/plain")
+
+        if parts.path.startswith("/feed/"):
+            name = parts.path.rsplit("/", 1)[-1].split(".")[0]
+            body = render_feed(
+                name, int(query.get("entries", 20)), int(query.get("body", 2000)),
+                query.get("format", "rss"), malformed=cfg.roll(cfg.malformed_rate),
+            )
+            etag = '"' + hashlib.md5(body).hexdigest() + '"'
+            if self.headers.get("If-None-Match") == etag:
+                self.stats["not_modified"] += 1
+                return self._send(304, b"", None, {"ETag": etag})
+            return self._send(200, body, "application/rss+xml", {"ETag": etag})
+        if parts.path == "/v2/everything":
+            body = render_newsapi(
+                query.get("q", ""), int(query.get("page", 1)), int(query.get("pageSize", 100)),
+                int(query.get("total", cfg.newsapi_total)),
+            )
+            return self._send(200, body, "application/json")
+        return self._send(404, b"not found", "text/plain")
+
+    def _send(self, status, body, content_type, headers=None):
+        self.send_response(status)
+        if content_type:
+            self.send_header("Content-Type", content_type)
+        for k, v in (headers or {}).items():
+            self.send_header(k, v)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        try:
+            self.wfile.write(body)
+        except (BrokenPipeError, ConnectionResetError):
+            pass   # the streaming parser hangs up once it has enough entries
+        self.stats["bytes"] += len(body)
+
+    def log_message(self, *args):
+        pass
+
+class QuietServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def handle_error(self, request, client_address):
+        # Clients that stop reading early (the streaming feed parser) just hang up
+        if not isinstance(sys.exc_info()[1], (BrokenPipeError, ConnectionResetError)):
+            super().handle_error(request, client_address)
+
+class FixtureServer:
+    """Runs the fixture handler on a background thread; use as a context manager."""
+
+    def __init__(self, config=None, host="127.0.0.1", port=0):
+        handler = type("Handler", (FixtureHandler,), {"config": config or FixtureConfig()})
+        handler.stats = {"requests": 0, "bytes": 0, "not_modified": 0, "failed": 0}
+        self.handler = handler
+        self.httpd = QuietServer((host, port), handler)
+        self.url = f"http://{host}:{self.httpd.server_address[1]}"
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    @property
+    def stats(self):
+        return self.handler.stats
+
+    def feed_url(self, name, entries=20, body=2000, fmt="rss"):
+        return f"{self.url}/feed/{name}.xml?entries={entries}&body={body}&format={fmt}"
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve recorded-style RSS/Atom and NewsAPI fixtures locally.")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency", type=float, default=0.02, help="seconds added to every response")
+    parser.add_argument("--jitter", type=float, default=0.0)
+    parser.add_argument("--failure-rate", type=float, default=0.0, help="fraction of requests answered with 500")
+    parser.add_argument("--malformed-rate", type=float, default=0.0, help="fraction of feeds served as broken XML")
+    parser.add_argument("--stall-rate", type=float, default=0.0, help="fraction of requests that hang")
+    parser.add_argument("--stall-seconds", type=float, default=30.0)
+    args = parser.parse_args()
+    config = FixtureConfig(args.latency, args.jitter, args.failure_rate, args.malformed_rate,
+                           args.stall_rate, args.stall_seconds)
+    with FixtureServer(config, port=args.port) as server:
+        print(f"Serving fixtures on {server.url} – e.g. {server.feed_url('variety', entries=200)}")
+        try:
+            server.thread.join()
+        except KeyboardInterrupt:
+            pass
+
+if __name__ == "__main__":
+    main()
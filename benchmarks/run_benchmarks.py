@@ -0,0 +1,262 @@
+import argparse
+import json
+import os
+import platform
+import random
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, HERE)
+
+# The feed cache and article store open on first use; point them at a scratch dir, not the real one
+os.environ.setdefault("NEXUS_CACHE_DIR", tempfile.mkdtemp(prefix="nexus-bench-"))
+
+import requests
+import nexus_core as core
+from fixture_server import headline
+
+# ────────────────────────────────────────────────────────────────
+# OFFLINE BENCHMARKS – every source is the local fixture server
+# ────────────────────────────────────────────────────────────────
+# Every run should hit the fixture server, not the cross-replica cache
+core.FEED_TTL = core.NEWSAPI_TTL = 0
+
+BASE_FEEDS = len(core.RSS_FEEDS)
+BASE_ENTITIES = len(core.EVERGENT_CLIENTS) + len(core.COMPETITORS)
+
+def free_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+class FixtureProcess:
+    """fixture_server.py in its own process, so its CPU doesn't count against ours."""
+
+    def __init__(self, args):
+        self.port = free_port()
+        self.url = f"http://127.0.0.1:{self.port}"
+        self.proc = subprocess.Popen(
+            [sys.executable, os.path.join(HERE, "fixture_server.py"), "--port", str(self.port), *args],
+            stdout=subprocess.DEVNULL,
+        )
+        for _ in range(100):
+            try:
+                requests.get(f"{self.url}/_stats", timeout=0.2)
+                return
+            except requests.ConnectionError:
+                time.sleep(0.05)
+        raise RuntimeError("fixture server did not start")
+
+    def stats(self):
+        return requests.get(f"{self.url}/_stats", timeout=2).json()
+
+    def close(self):
+        self.proc.terminate()
+        self.proc.wait()
+
+def fresh_state():
+    """New empty feed cache, article store and breakers so every measurement starts cold."""
+    path = tempfile.mkdtemp(prefix="nexus-bench-", dir=os.environ["NEXUS_CACHE_DIR"])
+    core.SHARED_CACHE = core.SharedCache(os.path.join(path, "cache.db"))
+    core.FEED_CACHE = core.FeedCache(core.SHARED_CACHE)
+    core.ARTICLE_STORE = core.ArticleStore(os.path.join(path, "articles.db"))
+    core.BREAKERS = core.CircuitBreakers()
+
+def measure(name, scale, fn, repeat):
+    """Best-of-`repeat` wall time plus process CPU time for that run."""
+    best = None
+    for _ in range(repeat):
+        setup = fn()
+        wall, cpu = time.perf_counter(), time.process_time()
+        extra = setup() or {}
+        wall, cpu = time.perf_counter() - wall, time.process_time() - cpu
+        if best is None or wall < best["wall_s"]:
+            best = {"name": name, "scale": scale, "wall_s": round(wall, 6), "cpu_s": round(cpu, 6), **extra}
+    items = best.get("items")
+    if items:
+        best["cpu_us_per_item"] = round(best["cpu_s"] / items * 1e6, 3)
+    return best
+
+def synthetic_entities(scale):
+    """The real watch lists plus (scale - 1) x as many made-up brands."""
+    extra = {}
+    for i in range(BASE_ENTITIES * (scale - 1)):
+        extra[f"Brand{i}"] = [f"brand{i} telecom", f"brand{i} media", f"b{i}tv"]
+    return extra
+
+def headlines(n, seed=1):
+    rng = random.Random(seed)
+    return [headline(rng, i) for i in range(n)]
+
+# ── individual benchmarks ───────────────────────────────────────
+def bench_matching(scale, repeat, articles=2000):
+    extra = synthetic_entities(scale)
+    titles = headlines(articles)
+
+    build_t = time.perf_counter()
+    matcher = core.EntityMatcher(core.EVERGENT_CLIENTS, core.COMPETITORS, extra, {core.DEAL_TAG: core.PRIORITY_KWS})
+    build_s = time.perf_counter() - build_t
+
+    def setup():
+        def run():
+            hits = sum(1 for t in titles if matcher.tag(t)[1])
+            return {"items": len(titles), "aliases": len(matcher.lookup), "build_s": round(build_s, 6), "priority_hits": hits}
+        return run
+    return measure("entity_matching", scale, setup, repeat)
+
+def bench_categorize(scale, repeat):
+    now = datetime.now()
+    feeds = core.RSS_FEEDS
+    items = [{"title": t, "pub": now, "source": feeds[i % len(feeds)][0], "category": feeds[i % len(feeds)][2]}
+             for i, t in enumerate(headlines(180 * scale))]
+
+    build_t = time.perf_counter()
+    taxonomy = core.Taxonomy.load()
+    build_s = time.perf_counter() - build_t
+
+    def setup():
+        def run():
+            counts = {}
+            for cat, _ in taxonomy.classify(items):
+                counts[cat] = counts.get(cat, 0) + 1
+            return {"items": len(items), "terms": len(taxonomy.terms), "build_s": round(build_s, 6), "categories": counts}
+        return run
+    return measure("categorize", scale, setup, repeat)
+
+def bench_fetch_feed(scale, repeat, server, body):
+    url = f"{server.url}/feed/bench{scale}.xml?entries={20 * scale}&body={body}"
+
+    def setup():
+        fresh_state()
+        def run():
+            notes = []
+            items = core.fetch_feed("Bench", url, "telco", notes=notes)
+            return {"items": len(items), "feed_entries": 20 * scale, "notes": len(notes)}
+        return run
+    return measure("fetch_feed", scale, setup, repeat)
+
+def bench_fetch_feed_304(repeat, server, body):
+    url = f"{server.url}/feed/bench304.xml?entries=20&body={body}"
+
+    def setup():
+        fresh_state()
+        core.fetch_feed("Bench", url, "telco")   # warm the validators
+        def run():
+            items = core.fetch_feed("Bench", url, "telco")
+            return {"items": len(items)}
+        return run
+    return measure("fetch_feed_not_modified", 1, setup, repeat)
+
+def bench_fetch_news_api(scale, repeat, server):
+    names = sorted(set(core.ALL_NAMES) | {a for aliases in synthetic_entities(scale).values() for a in aliases})
+
+    def setup():
+        fresh_state()
+        core.NEWSAPI_URL = f"{server.url}/v2/everything"
+        original = core.ALL_NAMES
+        def run():
+            core.ALL_NAMES = names
+            try:
+                notes = []
+                items = core.fetch_news_api("bench-key", notes=notes)
+            finally:
+                core.ALL_NAMES = original
+            return {"items": len(items), "watch_terms": len(names), "shards": len(core.plan_news_queries(core.watch_terms(names)))}
+        return run
+    return measure("fetch_news_api", scale, setup, repeat)
+
+def bench_load_all_news(scale, repeat, server, body):
+    feeds = [(f"Feed {i}", f"{server.url}/feed/load{i}.xml?entries=20&body={body}", "telco")
+             for i in range(BASE_FEEDS * scale)]
+
+    def setup():
+        fresh_state()
+        core.NEWSAPI_URL = f"{server.url}/v2/everything"
+        def run():
+            notes = []
+            added = core.load_all_news("bench-key", notes, feeds=feeds)
+            return {"items": added, "feeds": len(feeds), "warnings": sum(1 for level, _ in notes if level == "warning")}
+        return run
+    return measure("load_all_news", scale, setup, repeat)
+
+# ── driver ──────────────────────────────────────────────────────
+def compare(results, baseline_path, tolerance):
+    with open(baseline_path, encoding="utf-8") as f:
+        baseline = {(r["name"], r["scale"]): r for r in json.load(f)["results"]}
+    regressions = []
+    for r in results:
+        old = baseline.get((r["name"], r["scale"]))
+        if not old:
+            continue
+        for metric in ("wall_s", "cpu_us_per_item"):
+            if metric in r and metric in old and old[metric] > 0 and r[metric] > old[metric] * (1 + tolerance):
+                regressions.append(f"{r['name']}@{r['scale']}x {metric}: {old[metric]} -> {r[metric]}")
+    return regressions
+
+def main():
+    parser = argparse.ArgumentParser(description="Offline benchmarks for the Stellar Nexus ingestion pipeline.")
+    parser.add_argument("--scales", type=int, nargs="+", default=[1, 10, 100, 1000],
+                        help="multiples of today's feed count and watch-list size")
+    parser.add_argument("--network-scales", type=int, nargs="+", default=[10, 100, 1000],
+                        help="scales for benchmarks that hit the fixture server")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--latency", type=float, default=0.02, help="fixture server latency per response (s)")
+    parser.add_argument("--body", type=int, default=2000, help="bytes of HTML content per feed entry")
+    parser.add_argument("--failure-rate", type=float, default=0.0)
+    parser.add_argument("--malformed-rate", type=float, default=0.0)
+    parser.add_argument("--out", help="write JSON results here instead of stdout")
+    parser.add_argument("--baseline", help="earlier --out file; exit 1 if anything got slower than --tolerance")
+    parser.add_argument("--tolerance", type=float, default=0.25)
+    args = parser.parse_args()
+
+    server = FixtureProcess([
+        "--latency", str(args.latency),
+        "--failure-rate", str(args.failure_rate),
+        "--malformed-rate", str(args.malformed_rate),
+    ])
+    results = []
+    try:
+        for scale in args.scales:
+            results.append(bench_matching(scale, args.repeat))
+            results.append(bench_categorize(scale, args.repeat))
+        for scale in args.network_scales:
+            results.append(bench_fetch_feed(scale, args.repeat, server, args.body))
+            results.append(bench_fetch_news_api(scale, args.repeat, server))
+            results.append(bench_load_all_news(scale, args.repeat, server, args.body))
+        results.append(bench_fetch_feed_304(args.repeat, server, args.body))
+        fixture_stats = server.stats()
+    finally:
+        server.close()
+
+    report = {
+        "meta": {
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "args": vars(args),
+            "fixture_server": fixture_stats,
+        },
+        "results": results,
+    }
+    payload = json.dumps(report, indent=2, default=str)
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            f.write(payload)
+    else:
+        print(payload)
+
+    if args.baseline:
+        regressions = compare(results, args.baseline, args.tolerance)
+        for line in regressions:
+            print(f"REGRESSION {line}", file=sys.stderr)
+        sys.exit(1 if regressions else 0)
+
+if __name__ == "__main__":
+    main()
@@ -1,12 +1,12 @@
 import streamlit as st
-import feedparser
-import requests
 from datetime import datetime, timedelta
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from urllib.parse import urlsplit
 import html
-import re
+import os
 import time
 
+from nexus_core import ARTICLE_STORE, BREAKERS, COMPETITORS, EVERGENT_CLIENTS, TELEMETRY, get_refresh_worker
+
 # ────────────────────────────────────────────────────────────────
 # PAGE CONFIG + AUTO-REFRESH EVERY 5 MINUTES
 # ────────────────────────────────────────────────────────────────
@@ -135,228 +135,61 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
-# ────────────────────────────────────────────────────────────────
-# COMPREHENSIVE LISTS (all from your message)
-# ────────────────────────────────────────────────────────────────
-EVERGENT_CLIENTS = {
-    "Astro": ["astro malaysia", "astro sooka", "astro njoi", "astro", "sooka", "njoi"],
-    "MongolTV": ["mongoltv", "mongol tv", "mongolia tv"],
-    "FOX": ["fox sports", "fox corporation", "fox networks", "fox"],
-    "AT&T": ["at&t", "att inc", "att wireless", "directv"],
-    "NBA": ["nba", "national basketball"],
-    "Shahid": ["shahid", "shahid vip", "mbc shahid"],
-    "MBC": ["mbc group", "mbc", "middle east broadcasting"],
-    "TV ASAHI": ["tv asahi", "asahi television", "asahi tv"],
-    "TV3": ["tv3 malaysia", "tv3", "media prima"],
-    "ABS-CBN": ["abs-cbn", "abscbn", "abs cbn", "philippine broadcast"],
-    "Viki": ["viki", "rakuten viki", "viki streaming"],
-    "TRT": ["trt world", "trt", "turkish radio"],
-    "Sinclair": ["sinclair broadcast", "sinclair", "bally sports"],
-    "FanDuel": ["fanduel", "fanduel group", "flutter"],
-    "Bally Sports": ["bally sports", "bally regional", "diamond sports"],
-    "Gotham": ["gotham advanced", "gotham fc"],
-    "Marquee": ["marquee sports", "marquee network"],
-    "Sony": ["sony pictures", "sony entertainment", "sonyliv", "sony india"],
-    "Aha": ["aha video", "aha ott", "aha telugu"],
-    "BBC": ["bbc", "british broadcasting", "bbc iplayer"],
-    "Lightbox": ["lightbox", "spark lightbox"],
-    "Sky": ["sky nz", "sky new zealand", "sky tv", "sky uk", "sky italia", "sky deutschland"],
-    "Cignal": ["cignal tv", "cignal", "cignal satellite"],
-    "ETV": ["etv network", "etv bharat"],
-    "Simple TV": ["simpletv", "simple tv venezuela"],
-    "Telekom Malaysia": ["telekom malaysia", "tm unifi", "unifi tv", "tm"],
-    "Britbox": ["britbox", "britbox international"],
-    "Quickplay": ["quickplay", "quickplay media"],
-    "Pilipinas": ["pilipinas", "abs-cbn"],
-}
-
-COMPETITORS = {
-    "Netcracker": ["netcracker", "netcracker technology", "nec netcracker"],
-    "Amdocs": ["amdocs", "amdocs ltd", "amdocs inc"],
-    "CSG": ["csg systems", "csg international", "csg"],
-    "Oracle": ["oracle communications", "oracle corporation", "oracle telecom"],
-    "Ericsson": ["ericsson", "telefonaktiebolaget lm ericsson"],
-    "Nokia": ["nokia", "nokia networks", "nokia corporation"],
-    "Huawei": ["huawei", "huawei technologies"],
-    "Comarch": ["comarch", "comarch bss"],
-    "Tecnotree": ["tecnotree", "tecnotree corporation"],
-    "MATRIXX": ["matrixx", "matrixx software"],
-    "Optiva": ["optiva", "optiva inc"],
-    "Cerillion": ["cerillion", "cerillion plc"],
-    "AsiaInfo": ["asiainfo", "asiainfo technologies"],
-    "Hansen": ["hansen technologies", "hansen"],
-    "Openet": ["openet", "openet telecom"],
-    "ZTE": ["zte", "zte corporation"],
-    "Mavenir": ["mavenir", "mavenir systems"],
-    "Infosys": ["infosys", "infosys telecom"],
-    "TCS": ["tata consultancy", "tcs", "tata communications"],
-    "Wipro": ["wipro", "wipro digital"],
-    "Tech Mahindra": ["tech mahindra", "mahindra comviva"],
-    "Accenture": ["accenture", "accenture telecom"],
-    "Capgemini": ["capgemini", "capgemini telecom"],
-    "IBM": ["ibm", "ibm telecom", "ibm watson"],
-    "SAP": ["sap", "sap telecom"],
-    "Salesforce": ["salesforce", "salesforce communications"],
-}
-
-# Flatten all names for search
-ALL_NAMES = []
-for d in [EVERGENT_CLIENTS, COMPETITORS]:
-    for k, v in d.items():
-        ALL_NAMES.extend([k.lower()] + [x.lower() for x in v])
-
-ALL_NAMES = list(set(ALL_NAMES))  # unique
-
 # ────────────────────────────────────────────────────────────────
 # NEWSAPI KEY – secure & reliable
 # ────────────────────────────────────────────────────────────────
 news_api_key = None
 
-# 1. Prefer Streamlit Cloud secrets (recommended for production)
+# 1. Server-wide key: Streamlit Cloud secrets or $NEWS_API_KEY (used by the shared worker)
 try:
     news_api_key = st.secrets["news_api_key"]
 except:
-    pass
+    news_api_key = os.environ.get("NEWS_API_KEY")
 
-# 2. Fallback: sidebar input (for testing or local run)
+REFRESH_WORKER = get_refresh_worker()
+REFRESH_WORKER.set_news_api_key(news_api_key)
+
+# 2. Fallback: sidebar input (for testing or local run) – one fetch for this visitor, never stored server-wide
 if not news_api_key:
     st.sidebar.header("NewsAPI Key (for real-time news)")
-    news_api_key = st.sidebar.text_input(
+    visitor_key = st.sidebar.text_input(
         "Paste your NewsAPI key here",
         type="password",
         help="Get free key at https://newsapi.org/account"
     )
-    if not news_api_key:
+    job = st.session_state.get("visitor_fetch")
+    if not visitor_key:
         st.sidebar.info("Enter your NewsAPI key for full coverage of Evergent clients, competitors & telcos. Without it, only RSS feeds shown.")
-
-# ────────────────────────────────────────────────────────────────
-# NEWSAPI FETCH – covers EVERYTHING in your lists
-# ────────────────────────────────────────────────────────────────
-@st.cache_data(ttl=1800, show_spinner=False)
-def fetch_news_api(key):
-    if not key:
-        return []
-
-    # Build massive query with all your clients, competitors, telcos + topics
-    priority_part = " OR ".join([f"+{name}" for name in ALL_NAMES[:150]])  # safe limit to avoid URL overflow
-    topic_part = "('OTT streaming' OR 5G OR VoD OR VoIP OR telecom OR BSS OR OSS OR billing OR churn OR 'content delivery' OR 'subscription management')"
-
-    query = f"({priority_part} OR {topic_part}) NOT (crypto OR bitcoin OR nft OR ethereum)"
-
-    url = f"https://newsapi.org/v2/everything?q={requests.utils.quote(query)}&language=en&sortBy=publishedAt&pageSize=20&apiKey={key}"
-
-    try:
-        r = requests.get(url, timeout=10)
-        r.raise_for_status()
-        articles = r.json().get("articles", [])
-        items = []
-        for art in articles:
-            pub_str = art.get("publishedAt")
-            pub = datetime.fromisoformat(pub_str.replace("Z", "+00:00")) if pub_str else datetime.utcnow()
-            if (datetime.utcnow() - pub).days > 30: continue
-
-            full_text = (art.get("title", "") + " " + art.get("description", "")).lower()
-            priority = any(kw in full_text for kw in PRIORITY_KWS + ALL_NAMES)
-
-            items.append({
-                "title": art.get("title", "No title"),
-                "link": art.get("url", "#"),
-                "source": art["source"].get("name", "NewsAPI"),
-                "pub": pub,
-                "priority": priority
-            })
-        return items
-    except Exception as e:
-        st.sidebar.warning(f"NewsAPI failed: {str(e)}. Using RSS fallback.")
-        return []
-
-# ────────────────────────────────────────────────────────────────
-# RSS FETCH (your original feeds)
-# ────────────────────────────────────────────────────────────────
-RSS_FEEDS = [
-    ("Telecoms.com", "https://www.telecoms.com/feed", "telco"),
-    ("Light Reading", "https://www.lightreading.com/rss/simple", "telco"),
-    ("Fierce Telecom", "https://www.fierce-network.com/rss.xml", "telco"),
-    ("RCR Wireless", "https://www.rcrwireless.com/feed", "telco"),
-    ("Mobile World Live", "https://www.mobileworldlive.com/feed/", "telco"),
-    ("Variety", "https://variety.com/feed/", "ott"),
-    ("Digital TV Europe", "https://www.digitaltveurope.com/feed/", "ott"),
-    ("TechCrunch", "https://techcrunch.com/feed/", "technology"),
-    ("The Verge", "https://www.theverge.com/rss/index.xml", "technology"),
-]
-
-def clean(text):
-    return html.unescape(re.sub(r'<[^>]+>', '', str(text or ""))).strip()
-
-def fetch_feed(source, url, category):
-    items = []
-    try:
-        r = requests.get(url, headers={"User-Agent": "Mozilla/5.0"}, timeout=12)
-        feed = feedparser.parse(r.content)
-        cutoff = datetime.now() - timedelta(days=14)
-        for entry in feed.entries[:20]:
-            title = clean(entry.get("title", ""))
-            if len(title) < 30: continue
-            pub = None
-            for k in ("published_parsed", "updated_parsed"):
-                val = getattr(entry, k, None)
-                if val:
-                    try:
-                        pub = datetime(*val[:6])
-                        if pub < cutoff: continue
-                    except: pass
-            items.append({
-                "title": title,
-                "link": entry.get("link", "#"),
-                "source": source,
-                "pub": pub or datetime.now(),
-                "category": category,
-                "priority": any(kw in title.lower() for kw in PRIORITY_KWS + ALL_NAMES)
-            })
-    except Exception as e:
-        st.sidebar.warning(f"RSS fetch failed for {source}: {str(e)}")
-    return items
-
-@st.cache_data(ttl=900, show_spinner=False)
-def load_all_news():
-    api_items = fetch_news_api(news_api_key)
-    rss_items = []
-    try:
-        with ThreadPoolExecutor(max_workers=12) as ex:
-            futures = [ex.submit(fetch_feed, s, u, c) for s, u, c in RSS_FEEDS]
-            for f in as_completed(futures):
-                rss_items.extend(f.result())
-    except Exception as e:
-        st.sidebar.warning(f"RSS parallel fetch error: {str(e)}")
-
-    all_news = api_items + rss_items
-    all_news.sort(key=lambda x: (not x["priority"], x["pub"]), reverse=True)
-
-    categorized = {"telco": [], "ott": [], "technology": []}
-    for item in all_news:
-        title_lower = item["title"].lower()
-        if any(kw in title_lower for kw in ["telecom", "5g", "bss", "oss", "netcracker", "amdocs"]):
-            categorized["telco"].append(item)
-        elif any(kw in title_lower for kw in ["ott", "streaming", "vod", "sony"]):
-            categorized["ott"].append(item)
-        else:
-            categorized["technology"].append(item)
-
-    return categorized
+    elif st.session_state.get("visitor_key_hash") != hash(visitor_key) and (job is None or job.done()):
+        # One fetch in flight per session; a changed key waits for the running one
+        st.session_state.visitor_key_hash = hash(visitor_key)
+        st.session_state.visitor_fetch = job = REFRESH_WORKER.fetch_news_once(visitor_key)
+    if job is not None and job.done() and job.exception():
+        st.sidebar.warning(f"NewsAPI fetch with your key failed: {type(job.exception()).__name__}")
+    elif job is not None and job.done():
+        notes, added = job.result()
+        for level, note in notes:
+            getattr(st.sidebar, level)(note)
+        st.sidebar.caption(f"NewsAPI with your key: {added} new articles")
+    elif job is not None:
+        st.sidebar.caption("Fetching NewsAPI with your key…")
 
 # ────────────────────────────────────────────────────────────────
 # LOADING ANIMATION + HEADER + EVERGENT SPOTLIGHT
 # ────────────────────────────────────────────────────────────────
-placeholder = st.empty()
-with placeholder.container():
-    st.markdown("""
-        <div style="display:flex;flex-direction:column;justify-content:center;align-items:center;height:70vh;text-align:center;">
-            <h1 style="color:#0a192f;font-size:2.8rem;font-weight:800;">⚡ Igniting AI Powered Engine</h1>
-            <p style="color:#64748b;font-size:1.2rem;">Real-time Strategic Signals – Mergers, Acquisitions, Partnerships & Deals</p>
-        </div>
-    """, unsafe_allow_html=True)
-    time.sleep(1.2)
-placeholder.empty()
+# Opt-in splash (seconds); every rerun used to pay a fixed 1.2 s here
+SPLASH_SECONDS = float(os.environ.get("NEXUS_SPLASH_SECONDS", 0))
+if SPLASH_SECONDS > 0:
+    placeholder = st.empty()
+    with placeholder.container():
+        st.markdown("""
+            <div style="display:flex;flex-direction:column;justify-content:center;align-items:center;height:70vh;text-align:center;">
+                <h1 style="color:#0a192f;font-size:2.8rem;font-weight:800;">⚡ Igniting AI Powered Engine</h1>
+                <p style="color:#64748b;font-size:1.2rem;">Real-time Strategic Signals – Mergers, Acquisitions, Partnerships & Deals</p>
+            </div>
+        """, unsafe_allow_html=True)
+        time.sleep(SPLASH_SECONDS)
+    placeholder.empty()
 
 st.markdown("""
 <div class="header-container">
@@ -383,44 +216,159 @@ st.markdown("""
 </div>
 """, unsafe_allow_html=True)
 
+# Coverage trends from the store's pre-aggregated daily mention counts
+surging = ARTICLE_STORE.surging()
+_, trends = ARTICLE_STORE.mention_series(90)
+kind = lambda entity: "Client" if entity in EVERGENT_CLIENTS else "Competitor"
+trend_cols = {
+    "mentions": st.column_config.NumberColumn("Last 7 days"),
+    "baseline": st.column_config.NumberColumn("Weekly avg (prior 3 wks)"),
+    "change": st.column_config.NumberColumn("Change", format="%.1f×"),
+    "series": st.column_config.LineChartColumn("Daily mentions", y_min=0),
+}
+c1, c2 = st.columns([3, 2])
+with c1:
+    st.markdown("**🔥 Surging this week**")
+    if surging:
+        st.dataframe([{"entity": r["entity"], "type": kind(r["entity"]), **{k: r[k] for k in trend_cols}} for r in surging],
+                     column_config={**trend_cols, "series": st.column_config.LineChartColumn("Last 4 weeks", y_min=0)},
+                     use_container_width=True, hide_index=True)
+    else:
+        st.caption("Not enough recent mentions yet.")
+with c2:
+    st.markdown("**📈 90-day coverage**")
+    rows = sorted(({"entity": e, "type": kind(e), "mentions": sum(c[-7:]), "series": c} for e, c in trends.items()),
+                  key=lambda r: sum(r["series"]), reverse=True)
+    st.dataframe(rows, column_config={"mentions": trend_cols["mentions"], "series": trend_cols["series"]},
+                 use_container_width=True, hide_index=True, height=min(36 * (len(rows) + 1), 388))
+
 # ────────────────────────────────────────────────────────────────
 # MAIN NEWS GRID
 # ────────────────────────────────────────────────────────────────
-with st.spinner("Scanning NewsAPI + RSS for latest Evergent & ecosystem signals..."):
-    data = load_all_news()
+snapshot = REFRESH_WORKER.current()
+for level, note in snapshot.notes:
+    getattr(st.sidebar, level)(note)
+st.sidebar.caption(f"Snapshot v{snapshot.version} · updated {snapshot.built_at:%H:%M:%S} · {snapshot.added} new")
+
+def safe_link(link):
+    return html.escape(link, quote=True) if urlsplit(link or "").scheme in ("http", "https") else "#"
+
+def render_card(item, now):
+    age = (now - item["pub"]).total_seconds() / 3600
+    time_str = "Now" if age < 1 else f"{int(age)}h" if age < 24 else f"{int(age / 24)}d"
+    time_class = "time-hot" if age < 3 else "time-warm" if age < 12 else "time-normal"
+    card_class = "news-card-priority" if item["priority"] else "news-card"
+    extra = f'<span>• +{item["sources"]} sources</span>' if item.get("sources") else ""
+    return (
+        f'<div class="{card_class}">'
+        f'<a href="{safe_link(item["link"])}" target="_blank" rel="noopener" class="news-title">{html.escape(item["title"])}</a>'
+        f'<div class="news-meta"><span class="{time_class}">{time_str}</span><span>•</span>'
+        f'<span>{html.escape(item["source"])}</span>{extra}</div>'
+        f'</div>'
+    )
+
+def render_column(name, style, icon, items, now):
+    """Header plus every card as one HTML payload, so a column is a single delta."""
+    if items:
+        body = "".join(render_card(item, now) for item in items)
+    else:
+        body = '<div style="text-align:center; color:#94a3b8; padding:40px;">No recent signals – check key or refresh...</div>'
+    return f'<div class="{style}">{icon} {name}</div><div class="col-body">{body}</div>'
 
-cols = st.columns(3)
 sections = [
     ("telco", "TELCO OSS/BSS", "col-header-pink", "📡"),
     ("ott", "OTT & STREAMING", "col-header-purple", "📺"),
     ("technology", "AI & TECHWATCH", "col-header-orange", "⚡")
 ]
 
-for i, (cat, name, style, icon) in enumerate(sections):
-    with cols[i]:
-        st.markdown(f'<div class="{style}">{icon} {name}</div>', unsafe_allow_html=True)
-        items = data.get(cat, [])[:12]
-        if not items:
-            st.markdown('<div style="text-align:center; color:#94a3b8; padding:40px;">No recent signals – check key or refresh...</div>', unsafe_allow_html=True)
-            continue
-
-        for item in items:
-            time_ago = (datetime.now() - item["pub"]).total_seconds() / 3600
-            time_str = "Now" if time_ago < 1 else f"{int(time_ago)}h" if time_ago < 24 else f"{int(time_ago/24)}d"
-            time_class = "time-hot" if time_ago < 3 else "time-warm" if time_ago < 12 else "time-normal"
-
-            priority_class = "news-card-priority" if item["priority"] else "news-card"
-
-            st.markdown(f"""
-            <div class="{priority_class}">
-                <a href="{item['link']}" target="_blank" class="news-title">{html.escape(item['title'])}</a>
-                <div class="news-meta">
-                    <span class="{time_class}">{time_str}</span>
-                    <span>•</span>
-                    <span>{item['source']}</span>
-                </div>
-            </div>
-            """, unsafe_allow_html=True)
+# Only the grid polls: every 2 s while a cycle is landing sources, every 30 s otherwise.
+# Polling also wakes a stale worker, and a new finished snapshot redraws the whole page.
+@st.fragment(run_every=2 if snapshot.pending else 30)
+def news_grid():
+    current = REFRESH_WORKER.current()
+    if bool(current.pending) != bool(snapshot.pending) or (not current.pending and current.version != snapshot.version):
+        st.rerun()   # cycle started or finished – switch poll rate, redraw sidebar notes and spotlight
+    if current.pending:
+        st.caption(f"Still loading: {', '.join(current.pending)}")
+    cols = st.columns(3)
+    now = datetime.now()
+    for i, (cat, name, style, icon) in enumerate(sections):
+        cols[i].markdown(render_column(name, style, icon, current.columns.get(cat, ())[:12], now), unsafe_allow_html=True)
+
+news_grid()
+
+# ────────────────────────────────────────────────────────────────
+# ARCHIVE SEARCH – full-text + facets over every stored article
+# ────────────────────────────────────────────────────────────────
+ENTITY_NAMES = sorted(set(EVERGENT_CLIENTS) | set(COMPETITORS))
+CATEGORY_LABELS = {cat: name for cat, name, _, _ in sections}
+
+def first_page():
+    st.session_state["search_page"] = 1
+
+@st.fragment
+def archive_search():
+    with st.expander("🔎 Search the archive", expanded=bool(st.session_state.get("search_text"))):
+        text = st.text_input("Search titles and descriptions", key="search_text", on_change=first_page,
+                             placeholder='astro partnership · "5G streaming" OR billing · -nokia · acqui*')
+        c1, c2, c3, c4 = st.columns([2, 1.2, 2, 1.6])
+        entities = c1.multiselect("Entities (all of)", ENTITY_NAMES, key="search_entities", on_change=first_page)
+        categories = c2.multiselect("Category", list(CATEGORY_LABELS), format_func=CATEGORY_LABELS.get,
+                                    key="search_categories", on_change=first_page)
+        sources = c3.multiselect("Source", ARTICLE_STORE.sources(), key="search_sources", on_change=first_page)
+        today = datetime.now().date()
+        dates = c4.date_input("Published", (today - timedelta(days=30), today), key="search_dates", on_change=first_page)
+        if not (text.strip() or entities or categories or sources):
+            st.caption("Type a query or pick an entity, category or source to search every stored article.")
+            return
+
+        since = datetime.combine(dates[0], datetime.min.time()) if dates else None
+        until = datetime.combine(dates[-1], datetime.min.time()) + timedelta(days=1) if dates else None
+        started = time.perf_counter()
+        result = ARTICLE_STORE.search(text, entities, categories, sources, since, until,
+                                      page=st.session_state.get("search_page", 1))
+        elapsed = (time.perf_counter() - started) * 1000
+        st.caption(f"{result['total']:,}{'+ (newest shown)' if result['truncated'] else ''} articles · {elapsed:.0f} ms")
+        for name, counts in result["facets"].items():
+            if counts:
+                st.caption(f"**{name.title()}:** " + " · ".join(f"{k} ({v})" for k, v in counts.items()))
+        if result["results"]:
+            now = datetime.now()
+            st.markdown('<div class="col-body">' + "".join(render_card(item, now) for item in result["results"]) + "</div>",
+                        unsafe_allow_html=True)
+        if result["pages"] > 1:
+            st.number_input(f"Page (of {result['pages']})", min_value=1, max_value=result["pages"], key="search_page")
+
+archive_search()
+
+# ────────────────────────────────────────────────────────────────
+# ADMIN PANEL – per-source fetch telemetry (?admin=1 or NEXUS_ADMIN=1)
+# ────────────────────────────────────────────────────────────────
+if st.query_params.get("admin") == "1" or os.environ.get("NEXUS_ADMIN") == "1":
+    with st.expander("Source telemetry", expanded=True):
+        rows, breakers = [], BREAKERS.state()
+        for source, data in sorted(TELEMETRY.summary().items()):
+            metrics, counters, last = data["metrics"], data["counters"], data["last"]
+            p = lambda metric, q="p50": round(metrics[metric][q], 3) if metric in metrics else None
+            # A shared/fresh-TTL serve skips the publisher entirely, so it counts as a hit too
+            hits, shared, misses = counters.get("cache_hit", 0), counters.get("cache_shared", 0), counters.get("cache_miss", 0)
+            served = hits + shared
+            rows.append({
+                "source": source,
+                "total p50 s": p("total_seconds"), "total p95 s": p("total_seconds", "p95"),
+                "ttfb p50 s": p("ttfb_seconds"), "connect p50 s": p("connect_seconds"), "dns p50 s": p("dns_seconds"),
+                "parse p50 s": p("parse_seconds"), "bytes p50": p("response_bytes"),
+                "parsed": last.get("entries_parsed"), "kept": last.get("entries_kept"),
+                "short titles": last.get("dropped_short_title"), "too old": last.get("dropped_age"),
+                "cache hit %": round(100 * served / (served + misses)) if served + misses else None,
+                "shared": shared,
+                "errors": counters.get("errors", 0), "skipped": counters.get("skipped", 0),
+                "paused s": breakers.get(source, {}).get("retry_in"), "last": last.get("at"),
+            })
+        st.dataframe(rows, use_container_width=True, hide_index=True)
+        c1, c2 = st.columns(2)
+        c1.download_button("metrics.json", TELEMETRY.to_json(), "metrics.json", "application/json")
+        c2.download_button("metrics.prom", TELEMETRY.to_prometheus(), "metrics.prom", "text/plain")
 
 # ────────────────────────────────────────────────────────────────
 # FOOTER
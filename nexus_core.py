@@ -0,0 +1,1902 @@
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+from concurrent.futures import ThreadPoolExecutor, as_completed, TimeoutError as FuturesTimeout
+from collections import deque
+from bisect import bisect_right
+import argparse
+import csv
+import functools
+import hashlib
+import html
+import json
+import os
+import random
+import re
+import socket
+import sqlite3
+import struct
+import sys
+import threading
+import time
+import xml.etree.ElementTree as ET
+from email.utils import parsedate_to_datetime
+
+# Importing this module stays cheap: requests/urllib3 and feedparser load on
+# first fetch, and the singletons below that open files or compile the big
+# patterns are built on first use.
+class _Lazy:
+    """Stands in for a module-level singleton until an attribute is first used."""
+
+    def __init__(self, factory):
+        self._factory = factory
+        self._lock = threading.Lock()
+        self._obj = None
+
+    def __getattr__(self, name):
+        if self._obj is None:
+            with self._lock:
+                if self._obj is None:
+                    self._obj = self._factory()
+        return getattr(self._obj, name)
+
+# ────────────────────────────────────────────────────────────────
+# COMPREHENSIVE LISTS (all from your message)
+# ────────────────────────────────────────────────────────────────
+EVERGENT_CLIENTS = {
+    "Astro": ["astro malaysia", "astro sooka", "astro njoi", "astro", "sooka", "njoi"],
+    "MongolTV": ["mongoltv", "mongol tv", "mongolia tv"],
+    "FOX": ["fox sports", "fox corporation", "fox networks", "fox"],
+    "AT&T": ["at&t", "att inc", "att wireless", "directv"],
+    "NBA": ["nba", "national basketball"],
+    "Shahid": ["shahid", "shahid vip", "mbc shahid"],
+    "MBC": ["mbc group", "mbc", "middle east broadcasting"],
+    "TV ASAHI": ["tv asahi", "asahi television", "asahi tv"],
+    "TV3": ["tv3 malaysia", "tv3", "media prima"],
+    "ABS-CBN": ["abs-cbn", "abscbn", "abs cbn", "philippine broadcast"],
+    "Viki": ["viki", "rakuten viki", "viki streaming"],
+    "TRT": ["trt world", "trt", "turkish radio"],
+    "Sinclair": ["sinclair broadcast", "sinclair", "bally sports"],
+    "FanDuel": ["fanduel", "fanduel group", "flutter"],
+    "Bally Sports": ["bally sports", "bally regional", "diamond sports"],
+    "Gotham": ["gotham advanced", "gotham fc"],
+    "Marquee": ["marquee sports", "marquee network"],
+    "Sony": ["sony pictures", "sony entertainment", "sonyliv", "sony india"],
+    "Aha": ["aha video", "aha ott", "aha telugu"],
+    "BBC": ["bbc", "british broadcasting", "bbc iplayer"],
+    "Lightbox": ["lightbox", "spark lightbox"],
+    "Sky": ["sky nz", "sky new zealand", "sky tv", "sky uk", "sky italia", "sky deutschland"],
+    "Cignal": ["cignal tv", "cignal", "cignal satellite"],
+    "ETV": ["etv network", "etv bharat"],
+    "Simple TV": ["simpletv", "simple tv venezuela"],
+    "Telekom Malaysia": ["telekom malaysia", "tm unifi", "unifi tv", "tm"],
+    "Britbox": ["britbox", "britbox international"],
+    "Quickplay": ["quickplay", "quickplay media"],
+    "Pilipinas": ["pilipinas", "abs-cbn"],
+}
+
+COMPETITORS = {
+    "Netcracker": ["netcracker", "netcracker technology", "nec netcracker"],
+    "Amdocs": ["amdocs", "amdocs ltd", "amdocs inc"],
+    "CSG": ["csg systems", "csg international", "csg"],
+    "Oracle": ["oracle communications", "oracle corporation", "oracle telecom"],
+    "Ericsson": ["ericsson", "telefonaktiebolaget lm ericsson"],
+    "Nokia": ["nokia", "nokia networks", "nokia corporation"],
+    "Huawei": ["huawei", "huawei technologies"],
+    "Comarch": ["comarch", "comarch bss"],
+    "Tecnotree": ["tecnotree", "tecnotree corporation"],
+    "MATRIXX": ["matrixx", "matrixx software"],
+    "Optiva": ["optiva", "optiva inc"],
+    "Cerillion": ["cerillion", "cerillion plc"],
+    "AsiaInfo": ["asiainfo", "asiainfo technologies"],
+    "Hansen": ["hansen technologies", "hansen"],
+    "Openet": ["openet", "openet telecom"],
+    "ZTE": ["zte", "zte corporation"],
+    "Mavenir": ["mavenir", "mavenir systems"],
+    "Infosys": ["infosys", "infosys telecom"],
+    "TCS": ["tata consultancy", "tcs", "tata communications"],
+    "Wipro": ["wipro", "wipro digital"],
+    "Tech Mahindra": ["tech mahindra", "mahindra comviva"],
+    "Accenture": ["accenture", "accenture telecom"],
+    "Capgemini": ["capgemini", "capgemini telecom"],
+    "IBM": ["ibm", "ibm telecom", "ibm watson"],
+    "SAP": ["sap", "sap telecom"],
+    "Salesforce": ["salesforce", "salesforce communications"],
+}
+
+# Flatten all names for search
+ALL_NAMES = []
+for d in [EVERGENT_CLIENTS, COMPETITORS]:
+    for k, v in d.items():
+        ALL_NAMES.extend([k.lower()] + [x.lower() for x in v])
+
+ALL_NAMES = sorted(set(ALL_NAMES))  # unique, stable order across processes
+
+# Deal / strategic-move terms that flag a card as priority on their own
+PRIORITY_KWS = [
+    "evergent", "merger", "merge", "acquisition", "acquire", "acquires", "acquired",
+    "partnership", "partners with", "deal", "joint venture", "stake", "takeover", "buyout",
+]
+
+# ────────────────────────────────────────────────────────────────
+# ENTITY MATCHER – one compiled pattern, one scan per article
+# ────────────────────────────────────────────────────────────────
+DEAL_TAG = "__deal__"
+
+def trie_regex(words):
+    """Alternation of `words` folded into a character trie, e.g. fox, fox
+    sports, foxtel -> fox(?: sports|tel)?. re tries the branches of a flat
+    alternation one by one at every position, so cost grew with the alias
+    count; the trie shares prefixes and follows one branch per character.
+    Optional tails are greedy, so the longest word still wins."""
+    trie = {}
+    for word in words:
+        node = trie
+        for ch in word:
+            node = node.setdefault(ch, {})
+        node[""] = None   # a word ends here
+
+    def build(node):
+        branches = [re.escape(ch) + build(child) for ch, child in sorted(node.items()) if ch]
+        if not branches:
+            return ""
+        if len(branches) == 1 and "" not in node:
+            return branches[0]
+        group = "(?:" + "|".join(branches) + ")"
+        return group + "?" if "" in node else group
+
+    return build(trie)
+
+class EntityMatcher:
+    """Maps every alias to its canonical name(s) and scans text once with a
+    single compiled trie pattern. Aliases only match on whole words, so short
+    ones like "tm", "att" or "fox" don't fire inside unrelated words."""
+
+    def __init__(self, *alias_maps):
+        self.lookup = {}
+        for alias_map in alias_maps:
+            for canonical, aliases in alias_map.items():
+                for alias in [canonical, *aliases]:
+                    names = self.lookup.setdefault(alias.lower(), [])
+                    if canonical not in names:
+                        names.append(canonical)
+        self.pattern = re.compile(rf"(?<![a-z0-9])(?:{trie_regex(self.lookup)})(?![a-z0-9])")
+
+    def match(self, text):
+        found = set()
+        for m in self.pattern.finditer(str(text or "").lower()):
+            found.update(self.lookup[m.group(0)])
+        return found
+
+    def tag(self, text):
+        """Returns (sorted canonical entities, priority flag) from a single scan."""
+        found = self.match(text)
+        priority = bool(found)
+        found.discard(DEAL_TAG)
+        return sorted(found), priority
+
+ENTITY_MATCHER = _Lazy(lambda: EntityMatcher(EVERGENT_CLIENTS, COMPETITORS, {DEAL_TAG: PRIORITY_KWS}))
+
+# ────────────────────────────────────────────────────────────────
+# TELEMETRY – rolling per-source fetch/parse/match observations
+# ────────────────────────────────────────────────────────────────
+TELEMETRY_WINDOW = 200    # recent observations kept per source and metric
+LATENCY_BUCKETS = (0.01, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 20)
+
+def _quantile(values, q):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+class Telemetry:
+    """Keeps the last TELEMETRY_WINDOW values of every numeric field recorded
+    for a source, plus hit/miss/error counters. Metrics ending in _seconds
+    are exported as histograms, everything else as summaries."""
+
+    def __init__(self, window=TELEMETRY_WINDOW):
+        self.window = window
+        self.lock = threading.Lock()
+        self.series = {}      # (source, metric) -> deque of recent values
+        self.counters = {}    # (source, counter) -> running total
+        self.last = {}        # source -> latest value of every field
+
+    def record(self, source, **fields):
+        with self.lock:
+            last = self.last.setdefault(source, {})
+            last.update(fields, at=datetime.now().isoformat(timespec="seconds"))
+            for name, value in fields.items():
+                if name == "cache" and value:
+                    self._count(source, f"cache_{value}")
+                elif name == "error" and value:
+                    self._count(source, "errors")
+                elif name == "skipped" and value:
+                    self._count(source, "skipped")
+                elif isinstance(value, (int, float)) and not isinstance(value, bool):
+                    series = self.series.get((source, name))
+                    if series is None:
+                        series = self.series[(source, name)] = deque(maxlen=self.window)
+                    series.append(value)
+
+    def _count(self, source, counter):
+        self.counters[(source, counter)] = self.counters.get((source, counter), 0) + 1
+
+    def summary(self):
+        with self.lock:
+            series = {k: list(v) for k, v in self.series.items()}
+            counters = dict(self.counters)
+            last = {k: dict(v) for k, v in self.last.items()}
+        sources = {}
+        for (source, metric), values in series.items():
+            sources.setdefault(source, {"metrics": {}, "counters": {}, "last": last.get(source, {})})
+            sources[source]["metrics"][metric] = {
+                "count": len(values), "p50": _quantile(values, 0.5), "p95": _quantile(values, 0.95),
+                "max": max(values), "sum": sum(values),
+            }
+        for (source, counter), value in counters.items():
+            sources.setdefault(source, {"metrics": {}, "counters": {}, "last": last.get(source, {})})
+            sources[source]["counters"][counter] = value
+        return sources
+
+    def to_json(self):
+        return json.dumps({"generated": datetime.now().isoformat(timespec="seconds"), "sources": self.summary()},
+                          indent=2, default=str)
+
+    def to_prometheus(self):
+        with self.lock:
+            series = {k: list(v) for k, v in self.series.items()}
+            counters = dict(self.counters)
+        lines = []
+        for metric in sorted({m for _, m in series}):
+            name = f"nexus_{metric}"
+            is_latency = metric.endswith("_seconds")
+            lines.append(f"# TYPE {name} {'histogram' if is_latency else 'summary'}")
+            for (source, m), values in sorted(series.items()):
+                if m != metric:
+                    continue
+                label = source.replace("\\", "\\\\").replace('"', '\\"')
+                if is_latency:
+                    for le in LATENCY_BUCKETS:
+                        lines.append(f'{name}_bucket{{source="{label}",le="{le}"}} {sum(v <= le for v in values)}')
+                    lines.append(f'{name}_bucket{{source="{label}",le="+Inf"}} {len(values)}')
+                else:
+                    for q in (0.5, 0.95):
+                        lines.append(f'{name}{{source="{label}",quantile="{q}"}} {_quantile(values, q)}')
+                lines.append(f'{name}_sum{{source="{label}"}} {sum(values)}')
+                lines.append(f'{name}_count{{source="{label}"}} {len(values)}')
+        for counter in sorted({c for _, c in counters}):
+            name = f"nexus_{counter}_total"
+            lines.append(f"# TYPE {name} counter")
+            for (source, c), value in sorted(counters.items()):
+                if c == counter:
+                    label = source.replace("\\", "\\\\").replace('"', '\\"')
+                    lines.append(f'{name}{{source="{label}"}} {value}')
+        return "\n".join(lines) + "\n"
+
+    def write(self, directory):
+        """Drops metrics.prom (textfile-collector format) and metrics.json."""
+        try:
+            os.makedirs(directory, exist_ok=True)
+            for filename, payload in (("metrics.prom", self.to_prometheus()), ("metrics.json", self.to_json())):
+                tmp = os.path.join(directory, f"{filename}.tmp")
+                with open(tmp, "w", encoding="utf-8") as f:
+                    f.write(payload)
+                os.replace(tmp, os.path.join(directory, filename))
+        except OSError:
+            pass
+
+TELEMETRY = Telemetry()
+
+# Connection setup timings for the request running on this thread; pooled
+# keep-alive requests never touch them, so they read as zero.
+_conn_timing = threading.local()
+
+@functools.lru_cache(maxsize=None)
+def _timed_adapter():
+    """requests.HTTPAdapter whose urllib3 connections record DNS, connect
+    and TLS time into _conn_timing. Built on first use so importing this
+    module doesn't pull in the HTTP stack."""
+    from requests.adapters import HTTPAdapter
+    from urllib3.connection import HTTPConnection, HTTPSConnection
+    from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+    from urllib3.exceptions import NewConnectionError
+    from urllib3.util.connection import allowed_gai_family
+
+    class TimedHTTPConnection(HTTPConnection):
+        def _new_conn(self):
+            # Resolve once here and connect to those addresses, so the lookup
+            # that gets timed is the one actually used
+            started = time.perf_counter()
+            try:
+                infos = socket.getaddrinfo(self._dns_host, self.port, allowed_gai_family(), socket.SOCK_STREAM)
+            except OSError:
+                return super()._new_conn()   # raises urllib3's NameResolutionError
+            resolved = time.perf_counter()
+            host, error = self._dns_host, None
+            try:
+                for address in dict.fromkeys(info[4][0] for info in infos):
+                    self._dns_host = address
+                    try:
+                        sock = super()._new_conn()
+                        break
+                    except NewConnectionError as e:
+                        error = e   # refused / unreachable: next address, as create_connection would
+                else:
+                    raise error
+            finally:
+                self._dns_host = host
+            _conn_timing.dns_seconds = resolved - started
+            _conn_timing.connect_seconds = time.perf_counter() - resolved
+            return sock
+
+    class TimedHTTPSConnection(HTTPSConnection, TimedHTTPConnection):
+        def connect(self):
+            started = time.perf_counter()
+            super().connect()
+            setup = getattr(_conn_timing, "dns_seconds", 0.0) + getattr(_conn_timing, "connect_seconds", 0.0)
+            _conn_timing.tls_seconds = max(0.0, time.perf_counter() - started - setup)
+
+    class TimedHTTPPool(HTTPConnectionPool):
+        ConnectionCls = TimedHTTPConnection
+
+    class TimedHTTPSPool(HTTPSConnectionPool):
+        ConnectionCls = TimedHTTPSConnection
+
+    class TimedAdapter(HTTPAdapter):
+        def init_poolmanager(self, *args, **kwargs):
+            super().init_poolmanager(*args, **kwargs)
+            self.poolmanager.pool_classes_by_scheme = {"http": TimedHTTPPool, "https": TimedHTTPSPool}
+
+    return TimedAdapter
+
+# ────────────────────────────────────────────────────────────────
+# HTTP CLIENT – one pooled session + worker pool for the whole server
+# ────────────────────────────────────────────────────────────────
+HOST_CONCURRENCY = 4      # parallel requests allowed per publisher host
+REFRESH_BUDGET = 20       # seconds a full refresh may spend on the network
+
+class DeadlineExceeded(Exception):
+    pass
+
+def _release_on_close(close, slot):
+    released = threading.Event()
+
+    def close_and_release():
+        try:
+            close()
+        finally:
+            if not released.is_set():
+                released.set()
+                slot.release()
+    return close_and_release
+
+class FetchClient:
+    """Keep-alive connection pooling via one requests.Session, a cap on
+    in-flight requests per host, and a long-lived executor so refreshes
+    don't rebuild threads or re-handshake TLS. Tasks that themselves wait
+    on `executor` (the NewsAPI shard fan-out) go to `coordinator`: inside
+    the fetch pool they could fill it and wait on work that never starts."""
+
+    def __init__(self, max_workers=16, per_host=HOST_CONCURRENCY, coordinators=2):
+        self.max_workers = max_workers
+        self._session = None
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="nexus-fetch")
+        self.coordinator = ThreadPoolExecutor(max_workers=coordinators, thread_name_prefix="nexus-coord")
+        self.per_host = per_host
+        self.host_slots = {}
+        self.lock = threading.Lock()
+
+    @property
+    def session(self):
+        if self._session is None:
+            import requests
+            with self.lock:
+                if self._session is None:
+                    session = requests.Session()
+                    adapter = _timed_adapter()(pool_connections=32, pool_maxsize=self.max_workers)
+                    session.mount("https://", adapter)
+                    session.mount("http://", adapter)
+                    session.headers["User-Agent"] = "Mozilla/5.0"
+                    self._session = session
+        return self._session
+
+    def _slot(self, url):
+        host = urlsplit(url).netloc.lower()
+        with self.lock:
+            if host not in self.host_slots:
+                self.host_slots[host] = threading.BoundedSemaphore(self.per_host)
+            return self.host_slots[host]
+
+    def get(self, url, timeout=10, deadline=None, **kwargs):
+        """GET with the timeout clipped to whatever is left of `deadline`
+        (a time.monotonic() value). The response carries `timings`: DNS,
+        connect and TLS time (zero on a reused connection) and time to
+        headers. With stream=True the body is still to be read, so the host
+        slot stays taken until the response is closed – close it (or use it
+        as a context manager) on every path."""
+        if deadline is not None:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise DeadlineExceeded(f"refresh budget spent before {url}")
+            timeout = min(timeout, remaining)
+        _conn_timing.__dict__.clear()
+        slot = self._slot(url)
+        slot.acquire()
+        try:
+            r = self.session.get(url, timeout=timeout, **kwargs)
+        except BaseException:
+            slot.release()
+            raise
+        if kwargs.get("stream"):
+            r.close = _release_on_close(r.close, slot)
+        else:
+            slot.release()
+        r.timings = {
+            "dns_seconds": getattr(_conn_timing, "dns_seconds", 0.0),
+            "connect_seconds": getattr(_conn_timing, "connect_seconds", 0.0),
+            "tls_seconds": getattr(_conn_timing, "tls_seconds", 0.0),
+            "ttfb_seconds": r.elapsed.total_seconds(),
+        }
+        return r
+
+HTTP = FetchClient()
+
+# ────────────────────────────────────────────────────────────────
+# CIRCUIT BREAKERS – back off from failing sources, adapt timeouts
+# ────────────────────────────────────────────────────────────────
+BREAKER_THRESHOLD = 2        # consecutive failures before a source is skipped
+BREAKER_BASE_DELAY = 60      # seconds skipped after the first trip, doubling
+BREAKER_MAX_DELAY = 3600
+MIN_TIMEOUT = 2.0            # adaptive timeouts stay within [MIN_TIMEOUT, the caller's default]
+
+class CircuitBreakers:
+    """Per-source failure tracking. After BREAKER_THRESHOLD consecutive
+    failures a source is skipped for an exponentially growing delay, then
+    one trial fetch is let through (half-open). Each source's timeout is
+    3x its recent p95 latency plus a second, so a slow publisher can no
+    longer hold every refresh to the full default."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.failures = {}
+        self.open_until = {}
+        self.latencies = {}
+
+    def allow(self, source):
+        with self.lock:
+            until = self.open_until.get(source)
+            if until is None or time.monotonic() >= until:
+                return True
+            return False
+
+    def retry_in(self, source):
+        with self.lock:
+            return max(0.0, self.open_until.get(source, 0) - time.monotonic())
+
+    def timeout(self, source, default):
+        with self.lock:
+            samples = self.latencies.get(source)
+            if not samples or len(samples) < 3:
+                return default
+            return min(default, max(MIN_TIMEOUT, 3 * _quantile(samples, 0.95) + 1))
+
+    def record(self, source, ok, seconds=None):
+        with self.lock:
+            if ok:
+                self.failures[source] = 0
+                self.open_until.pop(source, None)
+                if seconds is not None:
+                    self.latencies.setdefault(source, deque(maxlen=50)).append(seconds)
+                return
+            failures = self.failures.get(source, 0) + 1
+            self.failures[source] = failures
+            if failures >= BREAKER_THRESHOLD:
+                delay = min(BREAKER_MAX_DELAY, BREAKER_BASE_DELAY * 2 ** (failures - BREAKER_THRESHOLD))
+                self.open_until[source] = time.monotonic() + delay
+
+    def state(self):
+        with self.lock:
+            now = time.monotonic()
+            return {source: {"failures": self.failures.get(source, 0),
+                             "retry_in": round(max(0.0, until - now))}
+                    for source, until in self.open_until.items() if until > now}
+
+BREAKERS = CircuitBreakers()
+
+# ────────────────────────────────────────────────────────────────
+# NEWSAPI FETCH – covers EVERYTHING in your lists
+# ────────────────────────────────────────────────────────────────
+NEWSAPI_URL = "https://newsapi.org/v2/everything"
+NEWSAPI_QUERY_CHARS = 500     # NewsAPI rejects longer q= values
+NEWSAPI_PAGE_SIZE = 100
+NEWSAPI_MAX_PAGES = 2         # per shard
+NEWSAPI_REQUEST_BUDGET = 20   # per refresh, across all shards
+NEWSAPI_TTL = int(os.environ.get("NEXUS_NEWSAPI_TTL", 1500))   # shared results stay fresh this long (s)
+NEWSAPI_EXCLUDE = "NOT (crypto OR bitcoin OR nft OR ethereum)"
+NEWSAPI_TOPICS = "('OTT streaming' OR 5G OR VoD OR VoIP OR telecom OR BSS OR OSS OR billing OR churn OR 'content delivery' OR 'subscription management')"
+
+def _word_spans(name):
+    """Every substring of `name` that starts and ends on a word boundary."""
+    starts = [i for i in range(len(name)) if name[i].isalnum() and (i == 0 or not name[i - 1].isalnum())]
+    ends = [i + 1 for i in range(len(name)) if name[i].isalnum() and (i + 1 == len(name) or not name[i + 1].isalnum())]
+    return (name[a:b] for a in starts for b in ends if b > a)
+
+def watch_terms(names=None):
+    """Drops aliases that already contain a shorter watched term as a whole
+    word ("fox sports" is covered by "fox"), so fewer shards are needed."""
+    kept = set()
+    for name in sorted(ALL_NAMES if names is None else names, key=lambda n: (len(n), n)):
+        if not any(span in kept for span in _word_spans(name)):
+            kept.add(name)
+    return sorted(kept)
+
+def plan_news_queries(terms, max_chars=NEWSAPI_QUERY_CHARS):
+    """Packs quoted terms into as few OR-queries as fit in max_chars. The
+    topic-keyword shard goes first, so a short budget never drops it."""
+    shards, current = [], []
+    overhead = len(f"() {NEWSAPI_EXCLUDE}")
+    for term in terms:
+        quoted = f'"{term}"'
+        if current and overhead + len(" OR ".join(current + [quoted])) > max_chars:
+            shards.append(current)
+            current = []
+        current.append(quoted)
+    if current:
+        shards.append(current)
+    return [f"{NEWSAPI_TOPICS} {NEWSAPI_EXCLUDE}"] + [f"({' OR '.join(shard)}) {NEWSAPI_EXCLUDE}" for shard in shards]
+
+def _news_page(key, query, page, deadline):
+    """One page of one shard: (articles, totalResults)."""
+    started = time.perf_counter()
+    # Key in a header, not the query string: request errors quote the URL and end up in notes
+    r = HTTP.get(NEWSAPI_URL, timeout=BREAKERS.timeout("NewsAPI", 10), deadline=deadline,
+                 headers={"X-Api-Key": key}, params={
+                     "q": query, "language": "en", "sortBy": "publishedAt",
+                     "pageSize": NEWSAPI_PAGE_SIZE, "page": page,
+                 })
+    body = r.content
+    elapsed = time.perf_counter() - started
+    TELEMETRY.record("NewsAPI", **r.timings, total_seconds=elapsed,
+                     response_bytes=len(body), error=None if r.ok else f"HTTP {r.status_code}")
+    r.raise_for_status()
+    BREAKERS.record("NewsAPI", ok=True, seconds=elapsed)
+    parse_started = time.perf_counter()
+    data = r.json()
+    TELEMETRY.record("NewsAPI", parse_seconds=time.perf_counter() - parse_started)
+    return data.get("articles", []), data.get("totalResults", 0)
+
+def _budget_spent(e, deadline):
+    """True when a failure is the refresh budget running out – the request
+    never started, or its timeout was clipped to the deadline and expired –
+    rather than the source failing. Those don't count against its breaker."""
+    return isinstance(e, DeadlineExceeded) or (deadline is not None and time.monotonic() >= deadline)
+
+def _short_error(e):
+    status = getattr(getattr(e, "response", None), "status_code", None)
+    return f"HTTP {status}" if status else type(e).__name__
+
+def _fetch_news_articles(key, deadline, notes):
+    """Raw articles from every shard, merged by article_id; None when all
+    shards failed. Pages go out in rounds: page 1 of every shard before any
+    page 2, and a page 2 only where totalResults says there is more, so the
+    request budget buys coverage first. A later page failing (e.g. 426 on
+    the developer plan) keeps what the shard already had."""
+    queries = plan_news_queries(watch_terms())
+    shards = [{"articles": [], "pages": 0, "more": True, "error": None, "skipped": False} for _ in queries]
+    budget = NEWSAPI_REQUEST_BUDGET
+    for page in range(1, NEWSAPI_MAX_PAGES + 1):
+        wanted = [i for i, shard in enumerate(shards) if shard["more"]]
+        run = wanted[:budget]
+        budget -= len(run)
+        for i in wanted[len(run):]:
+            shards[i]["more"] = False
+            shards[i]["skipped"] = page == 1
+        # One round runs concurrently; the next waits for it, never past the deadline
+        futures = {HTTP.executor.submit(_news_page, key, queries[i], page, deadline): i for i in run}
+        for f, i in futures.items():
+            shard = shards[i]
+            try:
+                batch, total = f.result(timeout=None if deadline is None else max(0, deadline - time.monotonic()) + 1)
+            except Exception as e:
+                if isinstance(e, FuturesTimeout):
+                    e = DeadlineExceeded("shard still running at the refresh deadline")
+                shard["budget_spent"] = _budget_spent(e, deadline)
+                shard["error"] = e if page == 1 else f"p{page} failed: {_short_error(e)}"
+                shard["more"] = False
+                continue
+            shard["articles"].extend(batch)
+            shard["pages"] += 1
+            shard["more"] = len(batch) == NEWSAPI_PAGE_SIZE and total > shard["pages"] * NEWSAPI_PAGE_SIZE
+
+    merged, report = {}, []
+    for i, shard in enumerate(shards):
+        if shard["skipped"]:
+            report.append(f"#{i + 1}: skipped (budget)")
+            continue
+        if not shard["pages"]:
+            report.append(f"#{i + 1}: failed")
+            continue
+        new = 0
+        for art in shard["articles"]:
+            key_id = article_id(art.get("url", "#"))
+            if key_id and key_id not in merged:
+                merged[key_id] = art
+                new += 1
+        line = f"#{i + 1}: {len(shard['articles'])} hits / {shard['pages']}p / {new} new"
+        report.append(line + (f" ({shard['error']})" if shard["error"] else ""))
+
+    notes.append(("caption", f"NewsAPI shards ({len(queries)}): " + " · ".join(report)))
+    skipped = sum(shard["skipped"] for shard in shards)
+    if skipped:
+        notes.append(("warning", f"NewsAPI request budget ({NEWSAPI_REQUEST_BUDGET}) ran out: "
+                                 f"{skipped} of {len(queries)} shards were not queried this cycle."))
+    failed = [shard for shard in shards if not shard["pages"] and not shard["skipped"]]
+    if failed and len(failed) == len(queries) - skipped:
+        if not all(shard.get("budget_spent") for shard in failed):
+            BREAKERS.record("NewsAPI", ok=False)
+        notes.append(("warning", f"NewsAPI failed: {failed[0]['error']}. Using RSS fallback."))
+        return None
+    return merged
+
+def fetch_news_api(key, deadline=None, notes=None):
+    notes = [] if notes is None else notes
+    if not key:
+        return []
+    if not BREAKERS.allow("NewsAPI"):
+        TELEMETRY.record("NewsAPI", skipped=True)
+        notes.append(("caption", f"NewsAPI paused after repeated failures – retrying in {BREAKERS.retry_in('NewsAPI'):.0f}s"))
+        return []
+
+    # Raw shard results are shared: one worker per NEWSAPI_TTL spends quota
+    cache_key = "newsapi:" + hashlib.sha1(key.encode()).hexdigest()[:16]
+    if SHARED_CACHE.lease(cache_key, NEWSAPI_TTL, deadline):
+        try:
+            merged = _fetch_news_articles(key, deadline, notes)
+            if merged is None:
+                return []
+            SHARED_CACHE.put(cache_key, merged)
+        finally:
+            SHARED_CACHE.release(cache_key)
+    else:
+        merged = SHARED_CACHE.get(cache_key) or {}
+        TELEMETRY.record("NewsAPI", cache="shared")
+        notes.append(("caption", f"NewsAPI: {len(merged)} results shared by another worker"))
+
+    known = ARTICLE_STORE.known_ids(merged)
+    items = []
+    dropped_age = 0
+    match_seconds = 0.0
+    for key_id, art in merged.items():
+        if key_id in known: continue
+        try:
+            pub_str = art.get("publishedAt")
+            pub = datetime.fromisoformat(pub_str.replace("Z", "+00:00")).replace(tzinfo=None) if pub_str else datetime.utcnow()
+        except ValueError:
+            continue
+        if (datetime.utcnow() - pub).days > 30:
+            dropped_age += 1
+            continue
+
+        full_text = (art.get("title") or "") + " " + (art.get("description") or "")
+        match_started = time.perf_counter()
+        entities, priority = ENTITY_MATCHER.tag(full_text)
+        match_seconds += time.perf_counter() - match_started
+
+        items.append({
+            "id": key_id,
+            "title": art.get("title") or "No title",
+            "link": art.get("url", "#"),
+            "source": (art.get("source") or {}).get("name") or "NewsAPI",
+            "pub": pub,
+            "priority": priority,
+            "entities": entities,
+            "summary": clean(art.get("description"))[:SUMMARY_CHARS],
+        })
+    TELEMETRY.record("NewsAPI", entries_parsed=len(merged), dropped_known=len(known), dropped_age=dropped_age,
+                     entries_kept=len(items), match_seconds=match_seconds)
+    return items
+
+# ────────────────────────────────────────────────────────────────
+# RSS FETCH (your original feeds)
+# ────────────────────────────────────────────────────────────────
+RSS_FEEDS = [
+    ("Telecoms.com", "https://www.telecoms.com/feed", "telco"),
+    ("Light Reading", "https://www.lightreading.com/rss/simple", "telco"),
+    ("Fierce Telecom", "https://www.fierce-network.com/rss.xml", "telco"),
+    ("RCR Wireless", "https://www.rcrwireless.com/feed", "telco"),
+    ("Mobile World Live", "https://www.mobileworldlive.com/feed/", "telco"),
+    ("Variety", "https://variety.com/feed/", "ott"),
+    ("Digital TV Europe", "https://www.digitaltveurope.com/feed/", "ott"),
+    ("TechCrunch", "https://techcrunch.com/feed/", "technology"),
+    ("The Verge", "https://www.theverge.com/rss/index.xml", "technology"),
+]
+
+def clean(text):
+    return html.unescape(re.sub(r'<[^>]+>', '', str(text or ""))).strip()
+
+# ────────────────────────────────────────────────────────────────
+# STREAMING FEED PARSER – stop after N entries or the age cutoff
+# ────────────────────────────────────────────────────────────────
+FEED_ENTRY_LIMIT = 20
+FEED_MAX_AGE = timedelta(days=14)
+SUMMARY_CHARS = 400            # description text kept per article for search
+SUMMARY_SCAN_CHARS = 4000      # raw markup looked at to get there
+
+def _local(tag):
+    return tag.rsplit("}", 1)[-1]
+
+def _feed_date(text):
+    """RFC 822 (RSS) or ISO 8601 (Atom) -> naive UTC, like feedparser's *_parsed."""
+    text = (text or "").strip()
+    if not text:
+        return None
+    try:
+        dt = parsedate_to_datetime(text)
+    except (TypeError, ValueError):
+        try:
+            dt = datetime.fromisoformat(text.replace("Z", "+00:00"))
+        except ValueError:
+            return None
+    if dt.tzinfo:
+        dt = (dt - dt.utcoffset()).replace(tzinfo=None)
+    return dt
+
+def _entry_fields(elem):
+    entry = {"title": "", "link": None, "id": None, "pub": None, "summary": ""}
+    updated = None
+    for child in elem:
+        name = _local(child.tag)
+        if name == "title" and not entry["title"]:
+            entry["title"] = "".join(child.itertext())
+        elif name == "link":
+            # RSS puts the URL in the text, Atom in href (prefer rel="alternate")
+            href = child.get("href") or (child.text or "").strip()
+            if href and (entry["link"] is None or child.get("rel", "alternate") == "alternate"):
+                entry["link"] = href
+        elif name in ("guid", "id"):
+            entry["id"] = (child.text or "").strip() or None
+        elif name in ("description", "summary") and not entry["summary"]:
+            entry["summary"] = "".join(child.itertext())[:SUMMARY_SCAN_CHARS]
+        elif name in ("pubDate", "published", "date"):
+            entry["pub"] = entry["pub"] or _feed_date(child.text)
+        elif name == "updated":
+            updated = _feed_date(child.text)
+    entry["pub"] = entry["pub"] or updated
+    return entry
+
+def _body_chunks(response, deadline=None, size=16384):
+    """The response body as it arrives, up to `deadline`. read1() returns
+    whatever the socket has rather than waiting for a full chunk, so a
+    trickling feed can't hold the thread far past the refresh budget."""
+    raw = getattr(response, "raw", None)
+    read1 = getattr(raw, "read1", None)
+    chunks = None if read1 else response.iter_content(chunk_size=size)
+    while True:
+        if deadline is not None and time.monotonic() >= deadline:
+            raise DeadlineExceeded("refresh budget ran out mid-download")
+        chunk = read1(size, decode_content=True) if read1 else next(chunks, b"")
+        if not chunk:
+            return
+        yield chunk
+
+def stream_feed_entries(response, limit=FEED_ENTRY_LIMIT, cutoff=None, stats=None, deadline=None):
+    """Pulls title/link/id/pub from an RSS or Atom response while it downloads
+    and stops reading after `limit` entries, the first entry older than
+    `cutoff`, or at `deadline`. Entry elements are cleared as soon as they're
+    read, so large content bodies never pile up. Malformed XML falls back to
+    feedparser on the full body. Bytes read, parse time and entry counts go
+    into `stats`. Always closes the response, which frees its host slot."""
+    stats = {} if stats is None else stats
+    stats.update(response_bytes=0, parse_seconds=0.0, entries_parsed=0, dropped_age=0, parser="stream")
+    parser = ET.XMLPullParser(events=("end",))
+    chunks = _body_chunks(response, deadline)
+    received = []
+    entries = []
+    parse_started = None
+    try:
+        for chunk in chunks:
+            received.append(chunk)
+            stats["response_bytes"] += len(chunk)
+            parse_started = time.perf_counter()
+            parser.feed(chunk)
+            for _, elem in parser.read_events():
+                if _local(elem.tag) not in ("item", "entry"):
+                    continue
+                entry = _entry_fields(elem)
+                elem.clear()
+                stats["entries_parsed"] += 1
+                if cutoff and entry["pub"] and entry["pub"] < cutoff:
+                    stats["dropped_age"] += 1
+                    return entries
+                entries.append(entry)
+                if len(entries) >= limit:
+                    return entries
+            stats["parse_seconds"] += time.perf_counter() - parse_started
+            parse_started = None
+        parser.close()
+        return entries
+    except ET.ParseError:
+        rest = b"".join(chunks)
+        stats["response_bytes"] += len(rest)
+        stats["parser"] = "feedparser"
+        parse_started = time.perf_counter()
+        return _feedparser_entries(b"".join(received) + rest, limit, cutoff, stats)
+    finally:
+        if parse_started is not None:
+            stats["parse_seconds"] += time.perf_counter() - parse_started
+        response.close()
+
+def _feedparser_entries(body, limit, cutoff, stats):
+    import feedparser   # only malformed feeds get here
+    entries = []
+    parsed = feedparser.parse(body).entries[:limit]
+    stats["entries_parsed"] = len(parsed)
+    for e in parsed:
+        pub = None
+        for k in ("published_parsed", "updated_parsed"):
+            val = e.get(k)
+            if val:
+                pub = datetime(*val[:6])
+                break
+        if cutoff and pub and pub < cutoff:
+            stats["dropped_age"] += 1
+            continue
+        entries.append({"title": e.get("title", ""), "link": e.get("link"), "id": e.get("id"), "pub": pub,
+                        "summary": (e.get("summary") or "")[:SUMMARY_SCAN_CHARS]})
+    return entries
+
+# ────────────────────────────────────────────────────────────────
+# SHARED CACHE – one SQLite file for every replica, plus conditional GET
+# ────────────────────────────────────────────────────────────────
+CACHE_DIR = os.environ.get("NEXUS_CACHE_DIR", ".nexus_cache")
+SHARED_CACHE_BYTES = int(os.environ.get("NEXUS_SHARED_CACHE_MB", "64")) * 1024 * 1024
+SHARED_CACHE_MAX_AGE = 7 * 86400   # entries not rewritten for a week are dropped outright
+LEASE_SECONDS = 60                 # a crashed refresher's lease lapses after this
+FEED_TTL = int(os.environ.get("NEXUS_FEED_TTL", "600"))
+
+class SharedCache:
+    """JSON values in one SQLite file (WAL mode), shared by every process
+    and replica pointed at the same CACHE_DIR. `lease()` gives single-flight
+    refreshes: the first caller to find a key stale refreshes it, and the
+    others serve the stale copy (or wait for the fresh one) instead of
+    fetching too. Entries are evicted least-recently-used beyond max_bytes
+    and unconditionally after SHARED_CACHE_MAX_AGE."""
+
+    def __init__(self, path, max_bytes=SHARED_CACHE_BYTES):
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self.max_bytes = max_bytes
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(path, timeout=30, isolation_level=None, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS entries (
+                key TEXT PRIMARY KEY,
+                value TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                stored_at REAL NOT NULL,
+                used_at REAL NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_entries_used ON entries (used_at);
+            CREATE TABLE IF NOT EXISTS leases (
+                key TEXT PRIMARY KEY,
+                owner TEXT NOT NULL,
+                until REAL NOT NULL
+            );
+        """)
+
+    @staticmethod
+    def _owner():
+        return f"{socket.gethostname()}:{os.getpid()}:{threading.get_ident()}"
+
+    def age(self, key):
+        with self.lock:
+            row = self.conn.execute("SELECT stored_at FROM entries WHERE key = ?", (key,)).fetchone()
+        return None if row is None else time.time() - row[0]
+
+    def get(self, key):
+        with self.lock:
+            row = self.conn.execute("SELECT value FROM entries WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            self.conn.execute("UPDATE entries SET used_at = ? WHERE key = ?", (time.time(), key))
+        return json.loads(row[0])
+
+    def put(self, key, value):
+        payload = json.dumps(value)
+        now = time.time()
+        with self.lock:
+            self.conn.execute("BEGIN IMMEDIATE")
+            try:
+                self.conn.execute("INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?)",
+                                  (key, payload, len(payload), now, now))
+                self._evict(now)
+                self.conn.execute("COMMIT")
+            except BaseException:
+                self.conn.execute("ROLLBACK")
+                raise
+
+    def touch(self, key):
+        """Marks `key` fresh again without rewriting its value (a 304)."""
+        now = time.time()
+        with self.lock:
+            self.conn.execute("UPDATE entries SET stored_at = ?, used_at = ? WHERE key = ?", (now, now, key))
+
+    def _evict(self, now):
+        self.conn.execute("DELETE FROM entries WHERE stored_at < ?", (now - SHARED_CACHE_MAX_AGE,))
+        self.conn.execute("DELETE FROM leases WHERE until < ?", (now,))
+        total = self.conn.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        for key, size in self.conn.execute("SELECT key, size FROM entries ORDER BY used_at").fetchall():
+            self.conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+            total -= size
+            if total <= self.max_bytes:
+                break
+
+    def _try_lease(self, key):
+        now = time.time()
+        owner = self._owner()
+        with self.lock:
+            self.conn.execute("BEGIN IMMEDIATE")
+            try:
+                self.conn.execute("DELETE FROM leases WHERE key = ? AND until < ?", (key, now))
+                self.conn.execute("INSERT OR IGNORE INTO leases VALUES (?, ?, ?)", (key, owner, now + LEASE_SECONDS))
+                holder = self.conn.execute("SELECT owner FROM leases WHERE key = ?", (key,)).fetchone()[0]
+                self.conn.execute("COMMIT")
+            except BaseException:
+                self.conn.execute("ROLLBACK")
+                raise
+        return holder == owner
+
+    def lease(self, key, ttl, deadline=None):
+        """True when the caller should refresh `key`: it is missing or older
+        than `ttl` and this thread now holds the lease, or another process
+        holds it but there is nothing to serve and waiting ran past
+        `deadline` (a time.monotonic() value). False means `get(key)` has
+        something to serve – fresh, or stale while someone else refreshes."""
+        while True:
+            age = self.age(key)
+            if age is not None and age < ttl:
+                return False
+            if self._try_lease(key):
+                return True
+            if age is not None:
+                return False
+            if deadline is None or time.monotonic() >= deadline:
+                return True
+            time.sleep(0.2)
+
+    def release(self, key):
+        with self.lock:
+            self.conn.execute("DELETE FROM leases WHERE key = ? AND owner = ?", (key, self._owner()))
+
+class FeedCache:
+    """Per-URL validators plus the parsed items from the last 200 response,
+    kept in the shared cache so unchanged feeds come back as 304s across
+    restarts and replicas."""
+
+    def __init__(self, shared):
+        self.shared = shared
+
+    def conditional_headers(self, url):
+        headers = {}
+        entry = self.shared.get(f"feed:{url}")
+        if entry:
+            if entry.get("etag"):
+                headers["If-None-Match"] = entry["etag"]
+            if entry.get("last_modified"):
+                headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def get_items(self, url):
+        entry = self.shared.get(f"feed:{url}")
+        if not entry:
+            return None
+        return [dict(item, pub=datetime.fromisoformat(item["pub"])) for item in entry["items"]]
+
+    def lease(self, url, deadline=None):
+        return self.shared.lease(f"feed:{url}", FEED_TTL, deadline)
+
+    def release(self, url):
+        self.shared.release(f"feed:{url}")
+
+    def revalidated(self, url, response):
+        """A 304: the cached items are current again, so restart the TTL
+        clock (and the week-long max age) and pick up any new validators."""
+        key = f"feed:{url}"
+        entry = self.shared.get(key)
+        if entry is None:
+            return
+        validators = {"etag": response.headers.get("ETag") or entry.get("etag"),
+                      "last_modified": response.headers.get("Last-Modified") or entry.get("last_modified")}
+        if validators["etag"] != entry.get("etag") or validators["last_modified"] != entry.get("last_modified"):
+            self.shared.put(key, dict(entry, **validators))
+        else:
+            self.shared.touch(key)
+
+    def store(self, url, response, items):
+        self.shared.put(f"feed:{url}", {
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+            "items": [dict(item, pub=item["pub"].isoformat()) for item in items],
+        })
+
+SHARED_CACHE = _Lazy(lambda: SharedCache(os.path.join(CACHE_DIR, "cache.db")))
+FEED_CACHE = FeedCache(SHARED_CACHE)
+
+# ────────────────────────────────────────────────────────────────
+# ARTICLE STORE – incremental SQLite history, deduped by link / GUID
+# ────────────────────────────────────────────────────────────────
+TRACKING_PARAMS = {"fbclid", "gclid", "mc_cid", "mc_eid", "ref"}
+
+def article_id(link, guid=None):
+    """Normalized link (scheme, www., tracking params, fragment and trailing
+    slash stripped) so the same story from two sources shares one row."""
+    if link and link != "#":
+        parts = urlsplit(link.strip())
+        host = parts.netloc.lower().removeprefix("www.")
+        query = urlencode([(k, v) for k, v in parse_qsl(parts.query) if not (k.lower().startswith("utm_") or k.lower() in TRACKING_PARAMS)])
+        return urlunsplit(("", host, parts.path.rstrip("/"), query, "")).lstrip("/")
+    return f"guid:{guid}" if guid else None
+
+# ────────────────────────────────────────────────────────────────
+# TAXONOMY – weighted terms + source priors from taxonomy.json
+# ────────────────────────────────────────────────────────────────
+TAXONOMY_PATH = os.environ.get("NEXUS_TAXONOMY", os.path.join(os.path.dirname(os.path.abspath(__file__)), "taxonomy.json"))
+
+class Taxonomy:
+    """Rule-based, multi-label classifier. Every term of every category is
+    compiled into one trie pattern; a category's score is the summed weight
+    of the distinct terms found in each field (scaled by the field weight),
+    plus `priors.declared` for the category an RSS feed declares and any
+    `priors.sources` entry for the outlet. Categories scoring at least
+    `min_score` are labels; the best one (ties go to config order) is the
+    primary category, or `default` if nothing scored at all."""
+
+    def __init__(self, config):
+        self.categories = list(config["categories"])
+        self.default = config.get("default", self.categories[-1])
+        self.min_score = float(config.get("min_score", 0))
+        self.fields = [(field, float(w)) for field, w in config.get("fields", {"title": 1.0}).items()]
+        priors = config.get("priors", {})
+        self.declared_prior = float(priors.get("declared", 0))
+        self.source_priors = priors.get("sources", {})
+        self.terms = {}
+        for cat, terms in config["categories"].items():
+            for term, weight in terms.items():
+                self.terms.setdefault(term.lower(), []).append((cat, float(weight)))
+        self.pattern = re.compile(rf"(?<![a-z0-9])(?:{trie_regex(self.terms)})(?![a-z0-9])")
+
+    @classmethod
+    def load(cls, path=TAXONOMY_PATH):
+        with open(path, encoding="utf-8") as f:
+            return cls(json.load(f))
+
+    def classify(self, items):
+        """[(primary, {category: score} for each label)] for `items`, from a
+        single scan over all their fields joined together."""
+        texts, starts, offset = [], [], 0
+        for item in items:
+            for field, _ in self.fields:
+                text = str(item.get(field) or "").lower().replace("\0", " ")
+                texts.append(text)
+                starts.append(offset)
+                offset += len(text) + 1
+        found = [set() for _ in texts]
+        for m in self.pattern.finditer("\0".join(texts)):
+            found[bisect_right(starts, m.start()) - 1].add(m.group(0))
+
+        results = []
+        for i, item in enumerate(items):
+            scores = dict.fromkeys(self.categories, 0.0)
+            for j, (_, field_weight) in enumerate(self.fields):
+                for term in found[i * len(self.fields) + j]:
+                    for cat, weight in self.terms[term]:
+                        scores[cat] += weight * field_weight
+            if item.get("category") in scores:
+                scores[item["category"]] += self.declared_prior
+            for cat, weight in self.source_priors.get(item.get("source"), {}).items():
+                if cat in scores:
+                    scores[cat] += weight
+            primary = max(self.categories, key=scores.__getitem__)
+            if scores[primary] <= 0:
+                primary = self.default
+            labels = {cat: round(score, 2) for cat, score in scores.items() if score >= self.min_score and score > 0}
+            labels.setdefault(primary, round(scores.get(primary, 0.0), 2))
+            results.append((primary, labels))
+        return results
+
+TAXONOMY = _Lazy(Taxonomy.load)
+
+def categorize(item):
+    return TAXONOMY.classify([item])[0][0]
+
+# ────────────────────────────────────────────────────────────────
+# NEAR-DUPLICATE CLUSTERING – MinHash/LSH over title character shingles
+# ────────────────────────────────────────────────────────────────
+MINHASH_PERMS = 32
+MINHASH_BANDS = 8                     # 8 bands x 4 rows: ~97% recall at 0.75 similarity
+MINHASH_THRESHOLD = 0.6               # estimated Jaccard needed to count as a copy
+CLUSTER_WINDOW = timedelta(days=3)    # copies of a story land within a few days
+_MERSENNE = (1 << 61) - 1
+_rng = random.Random(20240601)
+_PERMS = [(_rng.randrange(1, _MERSENNE), _rng.randrange(_MERSENNE)) for _ in range(MINHASH_PERMS)]
+
+def title_shingles(title):
+    text = " ".join(re.findall(r"[a-z0-9&]+", title.lower()))
+    return {text[i:i + 4] for i in range(max(len(text) - 3, 1))}
+
+def minhash(title):
+    hashes = [int.from_bytes(hashlib.blake2b(s.encode(), digest_size=8).digest(), "big") for s in title_shingles(title)]
+    return [min((a * h + b) % _MERSENNE for h in hashes) for a, b in _PERMS]
+
+def minhash_bands(signature):
+    rows = MINHASH_PERMS // MINHASH_BANDS
+    bands = []
+    for band in range(MINHASH_BANDS):
+        digest = hashlib.blake2b(struct.pack(f"<{rows}Q", *signature[band * rows:(band + 1) * rows]), digest_size=8).digest()
+        bands.append((band, int.from_bytes(digest, "big", signed=True)))
+    return bands
+
+def similarity(a, b):
+    return sum(x == y for x, y in zip(a, b)) / MINHASH_PERMS
+
+def _pack(signature):
+    return struct.pack(f"<{MINHASH_PERMS}Q", *signature)
+
+def _unpack(blob):
+    return struct.unpack(f"<{MINHASH_PERMS}Q", blob)
+
+MENTION_HOURLY_DAYS = 14   # hourly buckets older than this are dropped; daily ones are kept
+SEARCH_PAGE_SIZE = 20
+SEARCH_LIMIT = 5000      # matches ranked, paged and faceted per search
+FACET_LIMIT = 15
+
+def fts_query(text):
+    """User search text -> FTS5 MATCH expression over title + summary. Words
+    are ANDed, "quoted phrases" kept together, OR between terms, -word
+    excludes and a trailing * matches a prefix; anything else FTS5 would
+    treat as syntax is dropped. Returns None when nothing searchable is left."""
+    include, exclude, pending_or = [], [], False
+    for phrase, word in re.findall(r'"([^"]*)"|(\S+)', str(text or "")):
+        if word in ("OR", "|"):
+            pending_or = bool(include)
+            continue
+        if word in ("AND", "+", "&"):
+            continue
+        negate = word.startswith("-")
+        prefix = word.endswith("*")
+        tokens = re.findall(r"\w+", phrase or word)
+        if not tokens:
+            continue
+        term = '"' + " ".join(tokens) + '"' + ("*" if prefix and not phrase else "")
+        if negate:
+            exclude.append(term)
+        elif pending_or:
+            include[-1] = f"{include[-1]} OR {term}"
+            pending_or = False
+        else:
+            include.append(term)
+    excluded = " OR ".join(exclude)
+    if not include:
+        # FTS5 has no bare NOT, so exclusions alone start from the facet token every row carries
+        return f"facets : all NOT {{title summary}} : ({excluded})" if exclude else None
+    expr = " AND ".join(f"({term})" if " OR " in term else term for term in include)
+    return f"{{title summary}} : ({expr}{f' NOT ({excluded})' if exclude else ''})"
+
+def facet_token(kind, value):
+    """Token for one filter value in the FTS `facets` column: kind letter +
+    hex, so any source / category / entity name is one plain token. Must
+    agree with _facets_sql."""
+    return kind + value.encode().hex()
+
+def _facets_sql(row):
+    """SQL for the `facets` column of `row`: all, c<category>, s<source>,
+    m<yyyymm>, e<entity>..."""
+    return (f"'all c' || hex({row}.category) || ' s' || hex({row}.source)"
+            f" || ' m' || substr({row}.pub, 1, 4) || substr({row}.pub, 6, 2)"
+            f" || coalesce((SELECT ' e' || group_concat(hex(value), ' e') FROM json_each({row}.entities)), '')")
+
+def _month_tokens(since, until, limit=60):
+    """m<yyyymm> tokens covering [since, until], or None if that's unbounded
+    or too many to be worth it."""
+    if since is None:
+        return None
+    until = until or datetime.now()
+    months, (y, m) = [], (since.year, since.month)
+    while (y, m) <= (until.year, until.month) and len(months) <= limit:
+        months.append(f"m{y}{m:02d}")
+        y, m = (y + 1, 1) if m == 12 else (y, m + 1)
+    return months if len(months) <= limit else None
+
+class ArticleStore:
+    """Every article ever ingested, keyed by article_id. Ingest only
+    categorizes and writes rows it hasn't seen, and attaches each new row
+    to the cluster of an earlier near-duplicate title (one indexed LSH band
+    lookup per article rather than a pairwise scan). The grid reads
+    cluster representatives from the (category, priority, pub) index.
+    Triggers keep an FTS5 index over title + summary and an entity table
+    in step with every insert, so search never rebuilds anything."""
+
+    def __init__(self, path):
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")   # replicas share the file
+        # Replicas and cron runs open the file at the same time: every schema
+        # check and migration runs under one write lock, so the second opener
+        # sees the first one's finished schema rather than racing it
+        with self.conn:
+            self.conn.execute("BEGIN IMMEDIATE")
+            self._migrate()
+
+    def _script(self, script):
+        """executescript() commits first; this runs the statements inside
+        the caller's transaction instead."""
+        statement = ""
+        for part in script.split(";"):
+            statement += part + ";"
+            if sqlite3.complete_statement(statement):
+                if statement.strip(" \n;"):
+                    self.conn.execute(statement)
+                statement = ""
+
+    def _migrate(self):
+        """Creates or upgrades the schema. Caller holds BEGIN IMMEDIATE."""
+        self._script("""
+            CREATE TABLE IF NOT EXISTS articles (
+                id TEXT PRIMARY KEY,
+                title TEXT NOT NULL,
+                link TEXT NOT NULL,
+                source TEXT NOT NULL,
+                pub TEXT NOT NULL,
+                category TEXT NOT NULL,
+                priority INTEGER NOT NULL,
+                entities TEXT NOT NULL,
+                ingested TEXT NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_articles_grid ON articles (category, priority, pub);
+            CREATE TABLE IF NOT EXISTS minhash_bands (
+                band INTEGER NOT NULL,
+                value INTEGER NOT NULL,
+                id TEXT NOT NULL,
+                pub TEXT NOT NULL DEFAULT ''
+            );
+        """)
+        if "pub" not in {row[1] for row in self.conn.execute("PRAGMA table_info(minhash_bands)")}:
+            self._add_band_pub()
+        # pub last in the key: a band lookup only reads rows inside the cluster window
+        self.conn.execute("CREATE INDEX IF NOT EXISTS idx_minhash_bands_pub ON minhash_bands (band, value, pub)")
+        columns = {row[1] for row in self.conn.execute("PRAGMA table_info(articles)")}
+        if "cluster" not in columns:
+            self._add_cluster_columns()
+        self.conn.execute("CREATE INDEX IF NOT EXISTS idx_articles_cluster ON articles (cluster)")
+        if "summary" not in columns:
+            self.conn.execute("ALTER TABLE articles ADD COLUMN summary TEXT NOT NULL DEFAULT ''")
+        if "labels" not in columns:
+            self.conn.execute("ALTER TABLE articles ADD COLUMN labels TEXT NOT NULL DEFAULT '{}'")
+        fts_columns = {row[1] for row in self.conn.execute("PRAGMA table_info(articles_fts)")}
+        if "facets" not in fts_columns:
+            self._add_search_index(upgrade=bool(fts_columns))
+        if not self.conn.execute("SELECT 1 FROM sqlite_master WHERE name = 'mention_counts'").fetchone():
+            self._add_mention_counts()
+
+    def _add_mention_counts(self):
+        """Hourly ('h') and daily ('d') mention counts per entity, source and
+        category, plus an all-sources/all-categories row ('', '') per entity
+        and bucket for trend queries. Triggers adjust them on every insert and
+        delete, so trends never rescan articles; existing rows are counted
+        once here."""
+        # (grain, bucket = pub prefix length, per-source/category or the '' rollup)
+        views = [(grain, width, split) for grain, width in (("h", 13), ("d", 10)) for split in (True, False)]
+
+        def columns(row, grain, width, split):
+            dims = f"{row}.source, {row}.category" if split else "'', ''"
+            return f"'{grain}', substr({row}.pub, 1, {width}), j.value, {dims}"
+
+        def bump(row, sign):
+            return "".join(
+                f"""INSERT INTO mention_counts (grain, bucket, entity, source, category, n)
+                    SELECT {columns(row, *view)}, {sign}1 FROM json_each({row}.entities) j WHERE true
+                    ON CONFLICT DO UPDATE SET n = n {sign} 1;
+                """ for view in views)
+
+        self._script(f"""
+            CREATE TABLE IF NOT EXISTS mention_counts (
+                grain TEXT NOT NULL,
+                bucket TEXT NOT NULL,
+                entity TEXT NOT NULL,
+                source TEXT NOT NULL,
+                category TEXT NOT NULL,
+                n INTEGER NOT NULL,
+                PRIMARY KEY (grain, source, category, bucket, entity)
+            ) WITHOUT ROWID;
+            CREATE TRIGGER IF NOT EXISTS articles_counts_ai AFTER INSERT ON articles BEGIN
+                {bump("new", "+")}
+            END;
+            CREATE TRIGGER IF NOT EXISTS articles_counts_ad AFTER DELETE ON articles BEGIN
+                {bump("old", "-")}
+            END;
+        """)
+        hourly_since = (datetime.now() - timedelta(days=MENTION_HOURLY_DAYS)).isoformat()
+        for view in views:
+            self.conn.execute(f"""
+                INSERT INTO mention_counts (grain, bucket, entity, source, category, n)
+                    SELECT {columns("a", *view)}, COUNT(*) FROM articles a, json_each(a.entities) j
+                    WHERE '{view[0]}' = 'd' OR a.pub >= ? GROUP BY 1, 2, 3, 4, 5""", (hourly_since,))
+
+    def _add_search_index(self, upgrade=False):
+        """FTS5 over title + summary plus a `facets` column of filter tokens
+        (category, source, month, entities), so text searches narrowed by a
+        filter intersect posting lists instead of checking every text hit.
+        External content: the text lives only in `articles`, read through the
+        articles_search view. Also an entity -> article table, and the
+        triggers that fill both on insert. Existing rows are indexed once
+        here; `upgrade` replaces an index from before the facets column."""
+        if upgrade:
+            self._script("""
+                DROP TRIGGER IF EXISTS articles_search_ai;
+                DROP TRIGGER IF EXISTS articles_search_ad;
+                DROP TABLE IF EXISTS articles_fts;
+            """)
+        self._script(f"""
+            CREATE VIEW IF NOT EXISTS articles_search AS
+                SELECT a.rowid AS rid, a.title, a.summary, {_facets_sql("a")} AS facets FROM articles a;
+            CREATE VIRTUAL TABLE IF NOT EXISTS articles_fts USING fts5(
+                title, summary, facets, content='articles_search', content_rowid='rid',
+                tokenize='unicode61 remove_diacritics 2'
+            );
+            CREATE TABLE IF NOT EXISTS article_entities (
+                entity TEXT NOT NULL,
+                pub TEXT NOT NULL,
+                rid INTEGER NOT NULL,
+                PRIMARY KEY (entity, pub, rid)
+            ) WITHOUT ROWID;
+            CREATE INDEX IF NOT EXISTS idx_article_entities_rid ON article_entities (rid);
+            CREATE INDEX IF NOT EXISTS idx_articles_pub ON articles (pub);
+            CREATE INDEX IF NOT EXISTS idx_articles_source ON articles (source, pub);
+            CREATE TRIGGER IF NOT EXISTS articles_search_ai AFTER INSERT ON articles BEGIN
+                INSERT INTO articles_fts (rowid, title, summary, facets)
+                    VALUES (new.rowid, new.title, new.summary, {_facets_sql("new")});
+                INSERT OR IGNORE INTO article_entities SELECT value, new.pub, new.rowid FROM json_each(new.entities);
+            END;
+            CREATE TRIGGER IF NOT EXISTS articles_search_ad AFTER DELETE ON articles BEGIN
+                INSERT INTO articles_fts (articles_fts, rowid, title, summary, facets)
+                    VALUES ('delete', old.rowid, old.title, old.summary, {_facets_sql("old")});
+                DELETE FROM article_entities WHERE rid = old.rowid;
+            END;
+            -- Not 'rebuild': FTS5 can't rebuild from a view column with a subquery
+            INSERT INTO articles_fts (rowid, title, summary, facets) SELECT rid, title, summary, facets FROM articles_search;
+        """)
+        if not upgrade:
+            self.conn.execute("INSERT OR IGNORE INTO article_entities SELECT j.value, a.pub, a.rowid FROM articles a, json_each(a.entities) j")
+
+    def _add_cluster_columns(self):
+        """Upgrades a store created before clustering and clusters its rows
+        oldest-first."""
+        self.conn.execute("ALTER TABLE articles ADD COLUMN minhash BLOB")
+        self.conn.execute("ALTER TABLE articles ADD COLUMN cluster TEXT")
+        rows = self.conn.execute("SELECT id, title, pub, priority FROM articles ORDER BY ingested, pub").fetchall()
+        for key, title, pub, priority in rows:
+            signature = minhash(title)
+            cluster = self._assign_cluster(key, signature, datetime.fromisoformat(pub), priority)
+            self.conn.execute("UPDATE articles SET minhash = ?, cluster = ? WHERE id = ?",
+                              (_pack(signature), cluster, key))
+
+    def _add_band_pub(self):
+        """Upgrades a band table from before the pub column."""
+        self.conn.execute("ALTER TABLE minhash_bands ADD COLUMN pub TEXT NOT NULL DEFAULT ''")
+        self.conn.execute("UPDATE minhash_bands SET pub = (SELECT pub FROM articles WHERE id = minhash_bands.id)")
+        self.conn.execute("DROP INDEX IF EXISTS idx_minhash_bands")
+
+    def _assign_cluster(self, key, signature, pub, priority):
+        """Returns the cluster id for a new row and indexes its bands. Caller
+        holds the lock and the transaction."""
+        bands = minhash_bands(signature)
+        window = ((pub - CLUSTER_WINDOW).isoformat(), (pub + CLUSTER_WINDOW).isoformat())
+        # Only band rows inside the window: recurring headlines from other weeks never get read
+        where = " OR ".join("(b.band = ? AND b.value = ? AND b.pub BETWEEN ? AND ?)" for _ in bands)
+        candidates = self.conn.execute(
+            f"""SELECT DISTINCT a.id, a.minhash, a.pub, a.cluster FROM minhash_bands b
+                JOIN articles a ON a.id = b.id WHERE {where}""",
+            [x for band in bands for x in (*band, *window)],
+        ).fetchall()
+        cluster = key
+        for _, other_signature, other_pub, other_cluster in candidates:
+            if (similarity(signature, _unpack(other_signature)) >= MINHASH_THRESHOLD
+                    and abs(pub - datetime.fromisoformat(other_pub)) <= CLUSTER_WINDOW):
+                cluster = other_cluster
+                if priority:
+                    self.conn.execute("UPDATE articles SET priority = 1 WHERE id = ?", (cluster,))
+                break
+        self.conn.executemany("INSERT INTO minhash_bands (band, value, id, pub) VALUES (?, ?, ?, ?)",
+                              [(b, v, key, pub.isoformat()) for b, v in bands])
+        return cluster
+
+    def known_ids(self, ids):
+        with self.lock:
+            return self._known_ids(ids)
+
+    def _known_ids(self, ids):
+        ids = [i for i in ids if i]
+        known = set()
+        for start in range(0, len(ids), 500):
+            chunk = ids[start:start + 500]
+            rows = self.conn.execute(
+                f"SELECT id FROM articles WHERE id IN ({','.join('?' * len(chunk))})", chunk
+            )
+            known.update(row[0] for row in rows)
+        return known
+
+    def ingest(self, items):
+        """Inserts unseen items and returns how many were new."""
+        batch = {}
+        for item in items:
+            key = item.get("id") or article_id(item["link"])
+            if key and key not in batch:
+                batch[key] = item
+        now = datetime.now().isoformat()
+        added = 0
+        with self.lock, self.conn:
+            # Take the write lock before checking, so replicas ingesting the same feed don't both insert
+            self.conn.execute("BEGIN IMMEDIATE")
+            known = self._known_ids(batch)
+            new = [(key, item) for key, item in batch.items() if key not in known]
+            for (key, item), (category, labels) in zip(new, TAXONOMY.classify([item for _, item in new])):
+                signature = minhash(item["title"])
+                cluster = self._assign_cluster(key, signature, item["pub"], item["priority"])
+                self.conn.execute(
+                    """INSERT OR IGNORE INTO articles
+                       (id, title, link, source, pub, category, priority, entities, ingested, minhash, cluster, summary, labels)
+                       VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+                    (key, item["title"], item["link"], item["source"], item["pub"].isoformat(),
+                     category, int(item["priority"]), json.dumps(item.get("entities", [])), now,
+                     _pack(signature), cluster, item.get("summary") or "", json.dumps(labels)),
+                )
+                added += 1
+            if added:
+                cutoff = (datetime.now() - timedelta(days=MENTION_HOURLY_DAYS)).strftime("%Y-%m-%dT%H")
+                self.conn.execute("DELETE FROM mention_counts WHERE grain = 'h' AND bucket < ?", (cutoff,))
+        return added
+
+    def top(self, category, since, limit=50):
+        """Cluster representatives, each with `sources`: how many other
+        outlets carried the same story."""
+        with self.lock:
+            rows = self.conn.execute(
+                """SELECT id, title, link, source, pub, category, priority, entities, labels FROM articles
+                   WHERE category = ? AND pub >= ? AND cluster = id
+                   ORDER BY priority DESC, pub DESC LIMIT ?""",
+                (category, since.isoformat(), limit),
+            ).fetchall()
+            ids = [r[0] for r in rows]
+            counts = dict(self.conn.execute(
+                f"""SELECT cluster, COUNT(DISTINCT source) FROM articles
+                    WHERE cluster IN ({','.join('?' * len(ids))}) GROUP BY cluster""",
+                ids,
+            ).fetchall()) if ids else {}
+        return [
+            {"id": r[0], "title": r[1], "link": r[2], "source": r[3], "pub": datetime.fromisoformat(r[4]),
+             "category": r[5], "priority": bool(r[6]), "entities": json.loads(r[7]), "labels": json.loads(r[8]),
+             "sources": max(counts.get(r[0], 1) - 1, 0)}
+            for r in rows
+        ]
+
+    def search(self, text="", entities=(), categories=(), sources=(), since=None, until=None,
+               page=1, per_page=SEARCH_PAGE_SIZE):
+        """One page of matching articles, newest first, plus entity /
+        category / source facet counts. Every selected entity must be
+        tagged; categories and sources match any of those given;
+        `since`/`until` bound the publication time. Only the newest
+        SEARCH_LIMIT matches are paged and counted (`truncated` says there
+        were more), so broad queries cost the same as narrow ones."""
+        joins, where, args = [], [], []
+        expr = fts_query(text)
+        if str(text or "").strip() and not expr:
+            return {"total": 0, "page": 1, "pages": 0, "results": [], "facets": {}, "truncated": False}
+        bounds = [(op, value.isoformat()) for op, value in ((">=", since), ("<", until)) if value]
+        if expr:
+            # Filters become facet tokens ANDed into the MATCH, so FTS5 intersects
+            # posting lists instead of handing over every text hit to be checked
+            groups = [[facet_token("e", e)] for e in entities]
+            groups += [[facet_token("c", c) for c in categories], [facet_token("s", s) for s in sources],
+                       _month_tokens(since, until) or []]
+            expr = " AND ".join([expr, *(f"facets : ({' OR '.join(g)})" for g in groups if g)])
+            joins.append("JOIN articles_fts ON articles_fts.rowid = a.rowid")
+            where.append("articles_fts MATCH ?")
+            args.append(expr)
+        else:
+            for entity in entities:
+                # (entity, pub, rid) index: the date range narrows the entity list before touching articles
+                where.append("a.rowid IN (SELECT rid FROM article_entities WHERE entity = ?"
+                             + "".join(f" AND pub {op} ?" for op, _ in bounds) + ")")
+                args.extend([entity, *(value for _, value in bounds)])
+            # Unary + keeps the planner off the (category, priority, pub) grid index, which can't give pub order
+            for column, values in (("+a.category", categories), ("a.source", sources)):
+                if values:
+                    where.append(f"{column} IN ({','.join('?' * len(values))})")
+                    args.extend(values)
+        # Month tokens only narrow to whole months; the exact bounds always apply
+        for op, value in bounds:
+            where.append(f"a.pub {op} ?")
+            args.append(value)
+        matches = f"FROM articles a {' '.join(joins)} {'WHERE ' + ' AND '.join(where) if where else ''}"
+
+        # FTS hits stream in rowid (= ingest) order and stop at the limit; filter-only
+        # queries walk the pub index. Either way the window is then ordered by pub.
+        order = "articles_fts.rowid" if expr else "a.pub"
+        with self.lock:
+            window = self.conn.execute(
+                f"SELECT a.rowid, a.pub, a.category, a.source, a.entities {matches} ORDER BY {order} DESC LIMIT ?",
+                [*args, SEARCH_LIMIT],
+            ).fetchall()
+            window.sort(key=lambda r: r[1], reverse=True)
+            pages = -(-len(window) // per_page)
+            page = min(max(1, int(page)), max(pages, 1))
+            rids = [r[0] for r in window[(page - 1) * per_page:page * per_page]]
+            rows = self.conn.execute(
+                f"""SELECT id, title, link, source, pub, category, priority, entities, summary FROM articles
+                    WHERE rowid IN ({','.join('?' * len(rids))}) ORDER BY pub DESC""",
+                rids,
+            ).fetchall()
+
+        counts = {"category": {}, "source": {}, "entity": {}}
+        for _, _, category, source, tagged in window:
+            counts["category"][category] = counts["category"].get(category, 0) + 1
+            counts["source"][source] = counts["source"].get(source, 0) + 1
+            for entity in json.loads(tagged):
+                counts["entity"][entity] = counts["entity"].get(entity, 0) + 1
+        facets = {name: dict(sorted(c.items(), key=lambda kv: -kv[1])[:FACET_LIMIT]) for name, c in counts.items()}
+        return {
+            "total": len(window),
+            "page": page,
+            "pages": pages,
+            "results": [
+                {"id": r[0], "title": r[1], "link": r[2], "source": r[3], "pub": datetime.fromisoformat(r[4]),
+                 "category": r[5], "priority": bool(r[6]), "entities": json.loads(r[7]), "summary": r[8]}
+                for r in rows
+            ],
+            "facets": facets,
+            "truncated": len(window) == SEARCH_LIMIT,
+        }
+
+    def mention_series(self, buckets=30, grain="d", source="", category=""):
+        """(bucket labels, {entity: counts}) for the last `buckets` days
+        (grain "d") or hours ("h"), oldest first and zero-filled. Reads only
+        the pre-aggregated counts, so cost doesn't grow with the archive.
+        Leave source/category empty for all of them."""
+        now = datetime.now()
+        step, fmt = (timedelta(days=1), "%Y-%m-%d") if grain == "d" else (timedelta(hours=1), "%Y-%m-%dT%H")
+        labels = [(now - step * i).strftime(fmt) for i in range(buckets - 1, -1, -1)]
+        index = {label: i for i, label in enumerate(labels)}
+        if source or category:
+            where, args = ["source != ''"], []
+            for column, value in (("source", source), ("category", category)):
+                if value:
+                    where.append(f"{column} = ?")
+                    args.append(value)
+        else:
+            where, args = ["source = ''", "category = ''"], []   # the rollup rows
+        with self.lock:
+            rows = self.conn.execute(
+                f"""SELECT entity, bucket, n FROM mention_counts
+                    WHERE grain = ? AND {' AND '.join(where)} AND bucket >= ? AND bucket <= ?""",
+                (grain, *args, labels[0], labels[-1]),
+            ).fetchall()
+        series = {}
+        for entity, bucket, n in rows:
+            series.setdefault(entity, [0] * buckets)[index[bucket]] += n
+        return labels, series
+
+    def surging(self, days=7, baseline_weeks=3, limit=10, min_mentions=3):
+        """Entities whose mentions in the last `days` most exceed their
+        average over the `baseline_weeks` weeks before, with the daily
+        series behind it for sparklines."""
+        labels, series = self.mention_series(days * (baseline_weeks + 1))
+        ranked = []
+        for entity, counts in series.items():
+            recent = sum(counts[-days:])
+            baseline = sum(counts[:-days]) / baseline_weeks
+            if recent >= min_mentions:
+                ranked.append({"entity": entity, "mentions": recent, "baseline": round(baseline, 1),
+                               "change": (recent + 1) / (baseline + 1), "series": counts})
+        ranked.sort(key=lambda r: (r["change"], r["mentions"]), reverse=True)
+        return ranked[:limit]
+
+    def sources(self):
+        with self.lock:
+            return [r[0] for r in self.conn.execute("SELECT DISTINCT source FROM articles ORDER BY source")]
+
+ARTICLE_STORE = _Lazy(lambda: ArticleStore(os.path.join(CACHE_DIR, "articles.db")))
+
+def fetch_feed(source, url, category, deadline=None, notes=None):
+    notes = [] if notes is None else notes
+    items = []
+    if not FEED_CACHE.lease(url, deadline):
+        # Fresh from another worker, or one is refetching it right now
+        cached = FEED_CACHE.get_items(url) or []
+        cutoff = datetime.now() - FEED_MAX_AGE
+        items = [item for item in cached if item["pub"] >= cutoff]
+        TELEMETRY.record(source, cache="shared", entries_kept=len(items), dropped_age=len(cached) - len(items))
+        return items
+    try:
+        return _fetch_feed(source, url, category, deadline, notes)
+    finally:
+        FEED_CACHE.release(url)
+
+def _fetch_feed(source, url, category, deadline, notes):
+    items = []
+    if not BREAKERS.allow(source):
+        TELEMETRY.record(source, skipped=True)
+        notes.append(("caption", f"{source} paused after repeated failures – retrying in {BREAKERS.retry_in(source):.0f}s"))
+        return items
+    stats = {"cache": "miss", "error": None}
+    started = time.perf_counter()
+    timeout = BREAKERS.timeout(source, 12)
+    full_fetch = budget_spent = False
+    try:
+        r = HTTP.get(url, timeout=timeout, deadline=deadline, stream=True, headers=FEED_CACHE.conditional_headers(url))
+        stats.update(r.timings)
+        cutoff = datetime.now() - FEED_MAX_AGE
+        if r.status_code == 304:
+            r.close()
+            cached = FEED_CACHE.get_items(url)
+            if cached is not None:
+                stats["cache"] = "hit"
+                FEED_CACHE.revalidated(url, r)
+                items = [item for item in cached if item["pub"] >= cutoff]
+                stats.update(entries_kept=len(items), dropped_age=len(cached) - len(items))
+                return items
+            r = HTTP.get(url, timeout=timeout, deadline=deadline, stream=True)
+            stats.update(r.timings)
+        with r:   # an error status never reaches stream_feed_entries, which closes it otherwise
+            r.raise_for_status()
+            entries = stream_feed_entries(r, FEED_ENTRY_LIMIT, cutoff, stats, deadline)
+        known = ARTICLE_STORE.known_ids(article_id(e["link"], e["id"]) for e in entries)
+        stats.update(dropped_known=0, dropped_short_title=0, match_seconds=0.0)
+        for entry in entries:
+            key = article_id(entry["link"], entry["id"])
+            if key in known:
+                stats["dropped_known"] += 1
+                continue
+            title = clean(entry["title"])
+            if len(title) < 30:
+                stats["dropped_short_title"] += 1
+                continue
+            pub = entry["pub"]
+            match_started = time.perf_counter()
+            entities, priority = ENTITY_MATCHER.tag(title)
+            stats["match_seconds"] += time.perf_counter() - match_started
+            items.append({
+                "id": key,
+                "title": title,
+                "link": entry["link"] or "#",
+                "source": source,
+                "pub": pub or datetime.now(),
+                "category": category,
+                "priority": priority,
+                "entities": entities,
+                "summary": clean(entry["summary"])[:SUMMARY_CHARS],
+            })
+        stats["entries_kept"] = len(items)
+        FEED_CACHE.store(url, r, items)
+        full_fetch = True
+    except Exception as e:
+        stats["error"] = type(e).__name__
+        notes.append(("warning", f"RSS fetch failed for {source}: {str(e)}"))
+        budget_spent = _budget_spent(e, deadline)
+    finally:
+        stats["total_seconds"] = time.perf_counter() - started
+        TELEMETRY.record(source, **stats)
+        # Only full 200s teach the timeout: 304s are too cheap to say how long a body takes
+        if not budget_spent:
+            BREAKERS.record(source, ok=stats["error"] is None, seconds=stats["total_seconds"] if full_fetch else None)
+    return items
+
+def load_all_news(news_api_key, notes=None, feeds=None, on_progress=None):
+    """One ingestion cycle. Every source is fetched in the pool within
+    REFRESH_BUDGET and upserted into the article store as soon as it
+    answers; `on_progress(pending_sources, added_so_far)` fires after each
+    one so callers can publish partial results. Sources still running at
+    the deadline are reported and left to finish into the feed cache.
+    Returns how many articles were new; ("warning" | "caption", text)
+    pairs for the sidebar go to `notes`."""
+    notes = [] if notes is None else notes
+    refresh_started = time.perf_counter()
+    deadline = time.monotonic() + REFRESH_BUDGET
+    futures = {HTTP.executor.submit(fetch_feed, s, u, c, deadline, notes): s
+               for s, u, c in (RSS_FEEDS if feeds is None else feeds)}
+    if news_api_key:
+        # Waits on its own shard tasks, so it must not hold a fetch-pool thread
+        futures[HTTP.coordinator.submit(fetch_news_api, news_api_key, deadline, notes)] = "NewsAPI"
+    pending = set(futures.values())
+    added = 0
+    try:
+        for f in as_completed(futures, timeout=max(0, deadline - time.monotonic()) + 1):
+            pending.discard(futures[f])
+            try:
+                items = f.result()
+            except Exception as e:
+                notes.append(("warning", f"{futures[f]} failed: {str(e)}"))
+                continue
+            ingest_started = time.perf_counter()
+            new = ARTICLE_STORE.ingest(items)
+            added += new
+            TELEMETRY.record("store", ingest_seconds=time.perf_counter() - ingest_started,
+                             entries_parsed=len(items), entries_kept=new)
+            if on_progress:
+                on_progress(tuple(sorted(pending)), added)
+    except FuturesTimeout:
+        notes.append(("warning", f"Refresh hit the {REFRESH_BUDGET}s budget – still waiting on {', '.join(sorted(pending))}."))
+
+    TELEMETRY.record("refresh", total_seconds=time.perf_counter() - refresh_started)
+    return added
+
+def read_columns():
+    since = datetime.now() - timedelta(days=30)
+    return {cat: tuple(ARTICLE_STORE.top(cat, since)) for cat in ("telco", "ott", "technology")}
+
+# ────────────────────────────────────────────────────────────────
+# BACKGROUND REFRESH – ingestion off the script run, atomic snapshots
+# ────────────────────────────────────────────────────────────────
+REFRESH_INTERVAL = int(os.environ.get("NEXUS_REFRESH_INTERVAL", 900))    # RSS cadence (s)
+NEWSAPI_INTERVAL = int(os.environ.get("NEXUS_NEWSAPI_INTERVAL", 1800))   # NewsAPI quota cadence (s)
+# A render that finds the snapshot older than this wakes the worker early
+# and keeps serving the stale snapshot meanwhile (stale-while-revalidate).
+MAX_SNAPSHOT_AGE = int(os.environ.get("NEXUS_MAX_SNAPSHOT_AGE", 1200))
+
+@dataclass(frozen=True)
+class Snapshot:
+    version: int
+    built_at: datetime
+    columns: dict
+    notes: tuple
+    added: int = 0
+    pending: tuple = ()     # sources still loading in the current cycle
+
+class RefreshWorker:
+    """Daemon thread that runs load_all_news on its own cadence and swaps
+    in a new Snapshot each time a source lands, so columns fill in while
+    a cycle is still running. Renders only ever read `self.snapshot`,
+    which is replaced as a whole, never mutated."""
+
+    def __init__(self, interval=REFRESH_INTERVAL, newsapi_interval=NEWSAPI_INTERVAL):
+        self.interval = interval
+        self.newsapi_interval = newsapi_interval
+        self.news_api_key = None
+        self.last_newsapi = 0.0
+        self.wake = threading.Event()
+        self.publish_lock = threading.Lock()
+        # Serve what the store already holds until the first cycle lands
+        self.snapshot = Snapshot(0, datetime.now(), read_columns(), ())
+        self.thread = threading.Thread(target=self._run, name="nexus-refresh", daemon=True)
+        self.thread.start()
+
+    def set_news_api_key(self, key):
+        """The server-wide key (secrets / $NEWS_API_KEY) used every cycle.
+        Never pass visitor input here – see fetch_news_once."""
+        if key and key != self.news_api_key:
+            self.news_api_key = key
+            self.last_newsapi = 0.0
+            self.wake.set()
+
+    def current(self, max_age=MAX_SNAPSHOT_AGE):
+        snapshot = self.snapshot
+        if (datetime.now() - snapshot.built_at).total_seconds() > max_age:
+            self.wake.set()
+        return snapshot
+
+    def refresh(self):
+        notes = []
+        key = None
+        if self.news_api_key and time.monotonic() - self.last_newsapi >= self.newsapi_interval:
+            key = self.news_api_key
+            self.last_newsapi = time.monotonic()
+        self._publish(notes, 0, tuple(sorted([s for s, _, _ in RSS_FEEDS] + (["NewsAPI"] if key else []))))
+        try:
+            added = load_all_news(key, notes, on_progress=lambda pending, added: self._publish(notes, added, pending))
+        except Exception as e:
+            added = 0
+            notes.append(("warning", f"Refresh failed: {str(e)}"))
+        self._publish(notes, added, ())
+        TELEMETRY.write(CACHE_DIR)
+
+    def fetch_news_once(self, key):
+        """One NewsAPI pass with a visitor's own key, in the background. The
+        key isn't kept, and the returned future's notes are for that visitor
+        only; new articles reach everyone through the next snapshot."""
+        def run():
+            notes = []
+            added = ARTICLE_STORE.ingest(fetch_news_api(key, time.monotonic() + REFRESH_BUDGET, notes))
+            snapshot = self.snapshot
+            self._publish(snapshot.notes, snapshot.added + added, snapshot.pending)
+            return notes, added
+        return HTTP.coordinator.submit(run)
+
+    def _publish(self, notes, added, pending):
+        with self.publish_lock:
+            self.snapshot = Snapshot(self.snapshot.version + 1, datetime.now(), read_columns(), tuple(notes), added, pending)
+
+    def _run(self):
+        while True:
+            self.refresh()
+            self.wake.wait(self.interval)
+            self.wake.clear()
+
+@functools.lru_cache(maxsize=None)
+def get_refresh_worker():
+    """The process-wide worker; started on first use, never at import."""
+    return RefreshWorker()
+
+# ────────────────────────────────────────────────────────────────
+# CLI – one ingestion cycle, then a digest file (for cron / workers)
+#   python nexus_core.py --out digest.json
+#   python nexus_core.py --no-fetch --days 7 --out week.parquet
+# ────────────────────────────────────────────────────────────────
+DIGEST_FIELDS = ["category", "labels", "priority", "pub", "title", "source", "sources", "entities", "link"]
+
+def build_digest(days=1, limit=50, categories=("telco", "ott", "technology")):
+    """Cluster representatives per category from the article store, same
+    ordering as the dashboard columns, flattened to plain rows."""
+    since = datetime.now() - timedelta(days=days)
+    return [
+        {"category": cat, "labels": sorted(item["labels"], key=item["labels"].get, reverse=True),
+         "priority": item["priority"], "pub": item["pub"].isoformat(timespec="seconds"),
+         "title": item["title"], "source": item["source"], "sources": item["sources"],
+         "entities": item["entities"], "link": item["link"]}
+        for cat in categories
+        for item in ARTICLE_STORE.top(cat, since, limit)
+    ]
+
+def write_digest(rows, out, fmt):
+    if fmt == "json":
+        payload = json.dumps({"generated": datetime.now().isoformat(timespec="seconds"), "articles": rows}, indent=2)
+        if out == "-":
+            sys.stdout.write(payload + "\n")
+        else:
+            with open(out, "w", encoding="utf-8") as f:
+                f.write(payload)
+    elif fmt == "csv":
+        f = sys.stdout if out == "-" else open(out, "w", encoding="utf-8", newline="")
+        try:
+            writer = csv.DictWriter(f, fieldnames=DIGEST_FIELDS)
+            writer.writeheader()
+            writer.writerows(dict(row, labels="; ".join(row["labels"]), entities="; ".join(row["entities"])) for row in rows)
+        finally:
+            if f is not sys.stdout:
+                f.close()
+    elif fmt == "parquet":
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise SystemExit("Parquet output needs pyarrow: pip install pyarrow")
+        if out == "-":
+            raise SystemExit("Parquet output needs --out FILE")
+        pq.write_table(pa.Table.from_pylist(rows), out)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run one Stellar Nexus ingestion cycle and write a digest.")
+    parser.add_argument("--out", default="-", help="digest file; format follows the extension (default: JSON to stdout)")
+    parser.add_argument("--format", choices=["json", "csv", "parquet"], help="override the format implied by --out")
+    parser.add_argument("--days", type=float, default=1, help="digest window in days")
+    parser.add_argument("--limit", type=int, default=50, help="stories per category")
+    parser.add_argument("--news-api-key", default=os.environ.get("NEWS_API_KEY"), help="defaults to $NEWS_API_KEY")
+    parser.add_argument("--no-fetch", action="store_true", help="digest what the store already holds")
+    args = parser.parse_args(argv)
+    fmt = args.format or {".csv": "csv", ".parquet": "parquet"}.get(os.path.splitext(args.out)[1].lower(), "json")
+
+    if not args.no_fetch:
+        notes = []
+        started = time.perf_counter()
+        added = load_all_news(args.news_api_key, notes)
+        TELEMETRY.write(CACHE_DIR)
+        for level, note in notes:
+            print(f"{level}: {note}", file=sys.stderr)
+        print(f"ingested {added} new articles in {time.perf_counter() - started:.1f}s", file=sys.stderr)
+    rows = build_digest(args.days, args.limit)
+    write_digest(rows, args.out, fmt)
+    if args.out != "-":
+        print(f"wrote {len(rows)} stories to {args.out}", file=sys.stderr)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+import time
+from datetime import datetime
+
+import pytest
+
+import nexus_core as core
+
+@pytest.fixture
+def breakers(monkeypatch):
+    breakers = core.CircuitBreakers()
+    monkeypatch.setattr(core, "BREAKERS", breakers)
+    return breakers
+
+def expire(breakers, source):
+    breakers.open_until[source] = time.monotonic() - 1
+
+# ── backoff and half-open ───────────────────────────────────────
+def test_trips_after_threshold(breakers):
+    breakers.record("S", ok=False)
+    assert breakers.allow("S")
+    breakers.record("S", ok=False)
+    assert not breakers.allow("S")
+    assert breakers.retry_in("S") == pytest.approx(core.BREAKER_BASE_DELAY, abs=1)
+
+def test_delay_doubles_up_to_the_cap(breakers):
+    breakers.record("S", ok=False)
+    delays = []
+    for _ in range(8):
+        breakers.record("S", ok=False)
+        delays.append(round(breakers.retry_in("S")))
+    assert delays == [60, 120, 240, 480, 960, 1920, 3600, 3600]
+
+def test_half_open_trial_failure_reopens_longer(breakers):
+    breakers.record("S", ok=False)
+    breakers.record("S", ok=False)
+    expire(breakers, "S")
+    assert breakers.allow("S")            # one trial fetch after the pause
+    breakers.record("S", ok=False)        # a failed trial re-trips at once
+    assert not breakers.allow("S")
+    assert breakers.retry_in("S") == pytest.approx(2 * core.BREAKER_BASE_DELAY, abs=1)
+
+def test_half_open_trial_success_closes(breakers):
+    breakers.record("S", ok=False)
+    breakers.record("S", ok=False)
+    expire(breakers, "S")
+    breakers.record("S", ok=True)
+    assert breakers.allow("S") and breakers.state() == {}
+    breakers.record("S", ok=False)        # the count starts over
+    assert breakers.allow("S")
+
+def test_timeout_follows_recent_latency(breakers):
+    assert breakers.timeout("S", 12) == 12
+    for _ in range(5):
+        breakers.record("S", ok=True, seconds=0.1)
+    assert breakers.timeout("S", 12) == core.MIN_TIMEOUT
+    for _ in range(5):
+        breakers.record("S", ok=True, seconds=2.0)
+    assert breakers.timeout("S", 12) == pytest.approx(7.0)
+
+# ── what counts against a feed ──────────────────────────────────
+@pytest.fixture
+def feed_cache(tmp_path, monkeypatch):
+    cache = core.FeedCache(core.SharedCache(str(tmp_path / "cache.db")))
+    monkeypatch.setattr(core, "FEED_CACHE", cache)
+    return cache
+
+def test_spent_budget_is_not_a_source_failure(breakers, feed_cache):
+    for _ in range(3):
+        core._fetch_feed("S", "http://127.0.0.1:9/feed", "telco", time.monotonic() - 1, [])
+    assert breakers.allow("S") and breakers.failures.get("S", 0) == 0
+
+def test_refused_connection_is_a_source_failure(breakers, feed_cache):
+    for _ in range(2):
+        core._fetch_feed("S", "http://127.0.0.1:9/feed", "telco", time.monotonic() + 10, [])
+    assert not breakers.allow("S")
+
+class NotModified:
+    status_code = 304
+    headers = {}
+    timings = {}
+
+    def close(self):
+        pass
+
+def test_304s_dont_shrink_the_timeout(breakers, feed_cache, monkeypatch):
+    url = "http://example.com/feed"
+    feed_cache.store(url, NotModified(), [{"id": "a", "title": "t", "pub": datetime.now()}])
+    monkeypatch.setattr(core.HTTP, "get", lambda *args, **kwargs: NotModified())
+    for _ in range(5):
+        assert len(core._fetch_feed("S", url, "telco", None, [])) == 1
+    assert "S" not in breakers.latencies
+    assert breakers.timeout("S", 12) == 12
@@ -0,0 +1,150 @@
+import threading
+import time
+from datetime import datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+import nexus_core as core
+
+NOW = datetime(2026, 10, 18, 12)
+
+def rss(*items):
+    body = "".join(
+        f"<item><title>{title}</title><link>https://example.com/{i}</link>"
+        f"<pubDate>{pub.strftime('%a, %d %b %Y %H:%M:%S GMT')}</pubDate><description>about {title}</description></item>"
+        for i, (title, pub) in enumerate(items))
+    return f'<?xml version="1.0"?><rss version="2.0"><channel><title>T</title>{body}</channel></rss>'.encode()
+
+class FakeResponse:
+    """Serves `body` in small chunks and counts how many were read."""
+
+    def __init__(self, body, chunk=64, delay=0.0):
+        self.body, self.chunk, self.delay = body, chunk, delay
+        self.read = 0
+        self.closed = False
+
+    def iter_content(self, chunk_size):
+        for start in range(0, len(self.body), self.chunk):
+            time.sleep(self.delay)
+            self.read += 1
+            yield self.body[start:start + self.chunk]
+
+    def close(self):
+        self.closed = True
+
+    @property
+    def chunks(self):
+        return -(-len(self.body) // self.chunk)
+
+# ── early stop ──────────────────────────────────────────────────
+def test_stops_at_the_limit():
+    response = FakeResponse(rss(*[(f"Story {i}", NOW - timedelta(hours=i)) for i in range(50)]))
+    entries = core.stream_feed_entries(response, limit=3)
+    assert [e["title"] for e in entries] == ["Story 0", "Story 1", "Story 2"]
+    assert response.read < response.chunks and response.closed
+
+def test_stops_at_the_first_entry_past_the_cutoff():
+    items = [(f"Story {i}", NOW - timedelta(days=i)) for i in range(50)]
+    stats = {}
+    response = FakeResponse(rss(*items))
+    entries = core.stream_feed_entries(response, limit=100, cutoff=NOW - timedelta(days=2, hours=12), stats=stats)
+    assert len(entries) == 3
+    assert stats["dropped_age"] == 1 and stats["parser"] == "stream"
+    assert response.read < response.chunks
+
+def test_stops_at_the_deadline():
+    response = FakeResponse(rss(*[(f"Story {i}", NOW) for i in range(50)]), delay=0.05)
+    started = time.monotonic()
+    with pytest.raises(core.DeadlineExceeded):
+        core.stream_feed_entries(response, limit=100, deadline=started + 0.3)
+    assert time.monotonic() - started < 1
+    assert response.closed
+
+# ── formats ─────────────────────────────────────────────────────
+def test_atom_prefers_the_alternate_link():
+    body = b"""<?xml version="1.0"?><feed xmlns="http://www.w3.org/2005/Atom"><title>T</title>
+        <entry><title>Atom story</title><id>tag:example.com,2026:1</id>
+            <link rel="self" href="https://example.com/self"/>
+            <link rel="alternate" href="https://example.com/story"/>
+            <link rel="enclosure" href="https://example.com/audio.mp3"/>
+            <updated>2026-10-18T10:00:00+02:00</updated><summary>about it</summary></entry>
+        <entry><title>No rel</title><link href="https://example.com/plain"/><published>2026-10-17T10:00:00Z</published></entry>
+        </feed>"""
+    entries = core.stream_feed_entries(FakeResponse(body))
+    assert [e["link"] for e in entries] == ["https://example.com/story", "https://example.com/plain"]
+    assert entries[0]["id"] == "tag:example.com,2026:1"
+    assert entries[0]["pub"] == datetime(2026, 10, 18, 8)   # naive UTC
+    assert entries[0]["summary"] == "about it"
+
+def test_malformed_xml_falls_back_to_feedparser():
+    body = rss(("Fine story", NOW), ("AT&T story", NOW - timedelta(days=1)), ("Old story", NOW - timedelta(days=30)))
+    stats = {}
+    entries = core.stream_feed_entries(FakeResponse(body), cutoff=NOW - timedelta(days=14), stats=stats)
+    assert stats["parser"] == "feedparser"
+    assert [e["title"][:4] for e in entries] == ["Fine", "AT&T"]
+    assert stats["dropped_age"] == 1
+    assert stats["response_bytes"] == len(body)
+
+# ── host slots over a real connection ───────────────────────────
+class Handler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path == "/error":
+            self.send_response(500)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", "application/rss+xml")
+        self.end_headers()
+        if self.path == "/trickle":
+            self.wfile.write(b'<?xml version="1.0"?><rss><channel>')
+            for _ in range(200):   # a byte every 50 ms: every read succeeds, the body never ends
+                self.wfile.write(b" ")
+                self.wfile.flush()
+                time.sleep(0.05)
+        else:
+            self.wfile.write(rss(("Served story", NOW)))
+
+    def log_message(self, *args):
+        pass
+
+@pytest.fixture
+def server():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    httpd.daemon_threads = True
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{httpd.server_port}"
+    httpd.shutdown()
+
+@pytest.fixture
+def http():
+    client = core.FetchClient(max_workers=2, per_host=1)
+    yield client
+    client.executor.shutdown(wait=False)
+    client.coordinator.shutdown(wait=False)
+
+def test_streamed_response_holds_the_host_slot(server, http):
+    first = http.get(f"{server}/feed", stream=True)
+    second = []
+    waiter = threading.Thread(target=lambda: second.append(http.get(f"{server}/feed")))
+    waiter.start()
+    waiter.join(0.5)
+    assert not second             # the first body is still unread
+    assert len(core.stream_feed_entries(first)) == 1
+    waiter.join(5)
+    assert second and second[0].status_code == 200
+
+def test_error_status_frees_the_host_slot(server, http):
+    for _ in range(3):
+        with http.get(f"{server}/error", stream=True) as r:
+            assert r.status_code == 500
+    assert http._slot(server)._value == 1
+
+def test_trickling_body_stops_at_the_deadline(server, http):
+    started = time.monotonic()
+    r = http.get(f"{server}/trickle", stream=True, deadline=started + 1)
+    with pytest.raises(core.DeadlineExceeded):
+        core.stream_feed_entries(r, deadline=started + 1)
+    assert time.monotonic() - started < 2
+    assert http._slot(server)._value == 1
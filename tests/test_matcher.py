@@ -0,0 +1,79 @@
+import json
+import os
+import random
+import re
+
+import pytest
+
+import nexus_core as core
+from nexus_core import ENTITY_MATCHER, trie_regex
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# ── trie_regex ──────────────────────────────────────────────────
+def test_trie_shares_prefixes():
+    assert trie_regex(["fox", "fox sports", "foxtel"]) == "fox(?:\\ sports|tel)?"
+
+@pytest.mark.parametrize("words", [
+    ["a"], ["ab", "abc", "abd", "b"], ["at&t", "att inc", "att wireless", "a.b", "c++"],
+    sorted(core.ALL_NAMES),
+])
+def test_trie_matches_exactly_its_words(words):
+    pattern = re.compile(trie_regex(words))
+    for word in words:
+        assert pattern.fullmatch(word), word
+    for word in words:
+        for cut in range(1, len(word)):
+            assert bool(pattern.fullmatch(word[:cut])) == (word[:cut] in words)
+
+def flat(words):
+    # Longest first, so the flat alternation picks what the greedy trie picks
+    return "|".join(re.escape(w) for w in sorted(words, key=len, reverse=True))
+
+def bounded(body):
+    return re.compile(rf"(?<![a-z0-9])(?:{body})(?![a-z0-9])")
+
+def headlines():
+    with open(os.path.join(ROOT, "benchmarks", "taxonomy_fixtures.jsonl"), encoding="utf-8") as f:
+        titles = [json.loads(line)["title"].lower() for line in f if line.strip()]
+    rng = random.Random(7)
+    words = sorted(ENTITY_MATCHER.lookup) + ["the", "sportsman", "attending", "sapient", "foxes", "'s", "-"]
+    titles += [" ".join(rng.choice(words) for _ in range(12)) for _ in range(3000)]
+    return titles
+
+def test_trie_finds_what_a_flat_alternation_finds():
+    aliases = list(ENTITY_MATCHER.lookup)
+    trie, alternation = bounded(trie_regex(aliases)), bounded(flat(aliases))
+    for text in headlines():
+        assert [(m.span(), m.group()) for m in trie.finditer(text)] == \
+               [(m.span(), m.group()) for m in alternation.finditer(text)], text
+
+# ── EntityMatcher ───────────────────────────────────────────────
+@pytest.mark.parametrize("text, entities", [
+    ("Sapient wins a cloud deal", []),
+    ("SAP and Wipro sign deal", ["SAP", "Wipro"]),
+    ("AT&T's new fiber plan", ["AT&T"]),
+    ("Attending MWC this year", []),
+    ("TM launches unifi TV bundle", ["Telekom Malaysia"]),
+    ("Tmobile rebrands", []),
+    ("Fox Sports streams the NBA finals", ["FOX", "NBA"]),
+    ("Foxes spotted at the stadium", []),
+    ("ABS-CBN returns to free TV", ["ABS-CBN", "Pilipinas"]),
+    ("abscbn expands streaming", ["ABS-CBN"]),
+    ("Bally Sports sale closes", ["Bally Sports", "Sinclair"]),
+])
+def test_match_on_whole_words(text, entities):
+    assert sorted(ENTITY_MATCHER.match(text) - {core.DEAL_TAG}) == entities
+
+def test_tag_flags_deals_and_client_mentions():
+    assert ENTITY_MATCHER.tag("Amdocs completes acquisition of startup") == (["Amdocs"], True)
+    assert ENTITY_MATCHER.tag("Operators weigh a merger") == ([], True)
+    assert ENTITY_MATCHER.tag("Nokia ships new radios") == (["Nokia"], True)
+    assert ENTITY_MATCHER.tag("Weather turns cold") == ([], False)
+    assert ENTITY_MATCHER.tag(None) == ([], False)
+
+def test_alias_shared_by_canonical_names():
+    matcher = core.EntityMatcher({"A": ["shared", "a only"]}, {"B": ["shared"]})
+    assert matcher.lookup["shared"] == ["A", "B"]
+    assert matcher.match("the Shared story") == {"A", "B"}
+    assert matcher.match("an a only story") == {"A"}
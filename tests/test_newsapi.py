@@ -0,0 +1,38 @@
+import time
+
+import pytest
+
+import nexus_core as core
+
+@pytest.fixture
+def small_pool(monkeypatch):
+    http = core.FetchClient(max_workers=2, coordinators=2)
+    monkeypatch.setattr(core, "HTTP", http)
+    monkeypatch.setattr(core, "watch_terms", lambda: ["Amdocs", "Netcracker"])
+    yield http
+    http.executor.shutdown(wait=False, cancel_futures=True)
+    http.coordinator.shutdown(wait=False, cancel_futures=True)
+
+def fake_page(delays):
+    def page(key, query, page, deadline):
+        time.sleep(delays.get("Amdocs" in query, 0.05))
+        return [{"url": f"https://example.com/{hash(query)}/{page}"}], 1
+    return page
+
+def test_shard_fan_out_cannot_fill_the_fetch_pool(small_pool, monkeypatch):
+    monkeypatch.setattr(core, "_news_page", fake_page({}))
+    deadline = time.monotonic() + 5
+    # More waiting fan-outs than fetch threads: run inside the fetch pool these never finish
+    jobs = [small_pool.coordinator.submit(core._fetch_news_articles, "k", deadline, []) for _ in range(4)]
+    results = [job.result(timeout=10) for job in jobs]
+    assert all(len(merged) == 2 for merged in results)
+
+def test_hung_shard_is_bounded_by_the_deadline(small_pool, monkeypatch):
+    # The term shard hangs; the topic shard answers
+    monkeypatch.setattr(core, "_news_page", fake_page({True: 5}))
+    notes = []
+    started = time.monotonic()
+    merged = core._fetch_news_articles("k", started + 0.5, notes)
+    assert time.monotonic() - started < 3
+    assert len(merged) == 1
+    assert "#2: failed" in notes[0][1]
@@ -0,0 +1,91 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+import nexus_core as core
+from nexus_core import fts_query
+
+# ── fts_query ───────────────────────────────────────────────────
+@pytest.mark.parametrize("text, expected", [
+    ("amdocs", '{title summary} : ("amdocs")'),
+    ("Astro partnership", '{title summary} : ("Astro" AND "partnership")'),
+    ("Astro + partnership", '{title summary} : ("Astro" AND "partnership")'),
+    ('"5G streaming" deal', '{title summary} : ("5G streaming" AND "deal")'),
+    ("billing OR churn", '{title summary} : (("billing" OR "churn"))'),
+    ("billing | churn deal", '{title summary} : (("billing" OR "churn") AND "deal")'),
+    ("acq*", '{title summary} : ("acq"*)'),
+    ('"acq*"', '{title summary} : ("acq")'),
+    ("deal -nokia -ericsson", '{title summary} : ("deal" NOT ("nokia" OR "ericsson"))'),
+    ("-nokia", 'facets : all NOT {title summary} : ("nokia")'),
+    ("AT&T", '{title summary} : ("AT T")'),
+    ("NEAR(a b) ^c col:d", '{title summary} : ("NEAR a" AND "b" AND "c" AND "col d")'),
+])
+def test_fts_query(text, expected):
+    assert fts_query(text) == expected
+
+@pytest.mark.parametrize("text", ["", "   ", None, '""', "^ ( ) :", "OR", "AND OR"])
+def test_fts_query_nothing_searchable(text):
+    assert fts_query(text) is None
+
+def test_fts_query_leading_or_is_dropped():
+    assert fts_query("OR deal") == '{title summary} : ("deal")'
+
+# ── ArticleStore.search ─────────────────────────────────────────
+NOW = datetime(2026, 10, 18, 12)
+
+ROWS = [
+    # title, source, category, entities, days ago
+    ("Amdocs signs billing deal with Vodafone", "Light Reading", "telco", ["Amdocs"], 1),
+    ("Nokia wins 5G core network deal in Europe", "Light Reading", "telco", [], 2),
+    ("Netflix streaming deal with Sky NZ renewed", "Variety", "ott", ["Sky NZ"], 3),
+    ("Astro partnership brings sports to streaming app", "Variety", "ott", ["Astro"], 40),
+    ("Chipmaker results beat forecasts on data center demand", "TechCrunch", "technology", [], 5),
+    ("Amdocs and Astro extend partnership deal", "TechCrunch", "ott", ["Amdocs", "Astro"], 70),
+]
+
+@pytest.fixture
+def store(tmp_path):
+    store = core.ArticleStore(str(tmp_path / "articles.db"))
+    store.ingest([
+        {"id": f"a{i}", "title": title, "link": f"https://example.com/{i}", "source": source,
+         "category": category, "pub": NOW - timedelta(days=days), "priority": False,
+         "entities": entities, "summary": ""}
+        for i, (title, source, category, entities, days) in enumerate(ROWS)
+    ])
+    return store
+
+def titles(result):
+    return [r["title"] for r in result["results"]]
+
+def test_text_search_newest_first(store):
+    assert titles(store.search("deal")) == [ROWS[0][0], ROWS[1][0], ROWS[2][0], ROWS[5][0]]
+
+def test_negation_only(store):
+    result = store.search("-deal")
+    assert set(titles(result)) == {ROWS[3][0], ROWS[4][0]}
+
+def test_negation_with_facet(store):
+    assert titles(store.search("-nokia", sources=["Light Reading"])) == [ROWS[0][0]]
+
+def test_text_with_facets_matches_filter_only_path(store):
+    for kwargs in [dict(sources=["Variety"]), dict(categories=["ott", "technology"]), dict(entities=["Amdocs"]),
+                   dict(entities=["Amdocs", "Astro"]), dict(since=NOW - timedelta(days=4), until=NOW - timedelta(days=1, hours=12))]:
+        with_text = {r["id"] for r in store.search("deal", **kwargs)["results"]}
+        text_only = {r["id"] for r in store.search("deal")["results"]}
+        filter_only = {r["id"] for r in store.search(**kwargs)["results"]}
+        assert with_text == text_only & filter_only, kwargs
+
+def test_source_names_with_spaces_and_punctuation(tmp_path):
+    store = core.ArticleStore(str(tmp_path / "articles.db"))
+    store.ingest([{"id": "x", "title": "Operator deal closes", "link": "https://e.com/x", "source": "Fierce (Telecom) – EU",
+                   "pub": NOW, "priority": False, "entities": []}])
+    assert store.search("deal", sources=["Fierce (Telecom) – EU"])["total"] == 1
+    assert store.search("deal", sources=["Fierce"])["total"] == 0
+
+def test_junk_text_returns_nothing(store):
+    assert store.search("^ ( )")["total"] == 0
+
+def test_facets_counted(store):
+    facets = store.search("partnership")["facets"]
+    assert facets["entity"] == {"Astro": 2, "Amdocs": 1}
+    assert sum(facets["category"].values()) == 2   # categories come from the taxonomy
@@ -0,0 +1,80 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+import nexus_core as core
+
+@pytest.fixture
+def cache(tmp_path):
+    return core.SharedCache(str(tmp_path / "cache.db"))
+
+def in_thread(fn, *args):
+    """Runs fn on another thread, which counts as another lease owner."""
+    with ThreadPoolExecutor(1) as pool:
+        return pool.submit(fn, *args).result(timeout=10)
+
+def test_fresh_entry_is_served(cache):
+    cache.put("k", {"v": 1})
+    assert cache.lease("k", ttl=60) is False
+    assert cache.get("k") == {"v": 1}
+
+def test_missing_entry_is_leased_once(cache):
+    assert cache.lease("k", ttl=60) is True
+    # Nothing to serve and the deadline has passed: fetch anyway rather than show nothing
+    assert in_thread(cache.lease, "k", 60, time.monotonic()) is True
+    assert in_thread(cache._try_lease, "k") is False
+
+def test_stale_entry_single_flight(cache):
+    cache.put("k", {"v": 1})
+    assert cache.lease("k", ttl=0) is True
+    assert in_thread(cache.lease, "k", 0) is False   # serves the stale copy meanwhile
+    cache.release("k")
+    assert in_thread(cache.lease, "k", 0) is True
+
+def test_waiter_gets_the_leaseholders_value(cache):
+    assert cache.lease("k", ttl=60) is True
+
+    def refresh():
+        time.sleep(0.3)
+        cache.put("k", {"v": 2})
+        cache.release("k")
+    threading.Thread(target=refresh).start()
+    started = time.monotonic()
+    assert in_thread(cache.lease, "k", 60, time.monotonic() + 5) is False
+    assert time.monotonic() - started < 2
+    assert cache.get("k") == {"v": 2}
+
+def test_crashed_leaseholder_lapses(cache, monkeypatch):
+    monkeypatch.setattr(core, "LEASE_SECONDS", 0.1)
+    assert cache.lease("k", ttl=60) is True
+    time.sleep(0.2)
+    assert in_thread(cache._try_lease, "k") is True
+
+def test_leases_shared_across_connections(tmp_path):
+    a = core.SharedCache(str(tmp_path / "cache.db"))
+    b = core.SharedCache(str(tmp_path / "cache.db"))
+    assert a.lease("k", ttl=60) is True
+    assert in_thread(b._try_lease, "k") is False
+    a.put("k", [1])
+    a.release("k")
+    assert b.lease("k", ttl=60) is False
+    assert b.get("k") == [1]
+
+def test_touch_restarts_the_ttl(cache):
+    cache.put("k", {"v": 1})
+    cache.conn.execute("UPDATE entries SET stored_at = stored_at - 1000")
+    assert cache.age("k") > 999
+    cache.touch("k")
+    assert cache.age("k") < 1
+
+def test_least_recently_used_evicted_first(tmp_path):
+    cache = core.SharedCache(str(tmp_path / "cache.db"), max_bytes=250)
+    cache.put("a", "x" * 100)
+    cache.put("b", "x" * 100)
+    time.sleep(0.01)
+    cache.get("a")
+    cache.put("c", "x" * 100)
+    assert cache.get("b") is None
+    assert cache.get("a") and cache.get("c")
@@ -0,0 +1,121 @@
+import os
+import sqlite3
+import subprocess
+import sys
+import time
+from datetime import datetime, timedelta
+
+import nexus_core as core
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# ── concurrent opens ────────────────────────────────────────────
+OPEN_AT = """
+import sys, time
+import nexus_core
+time.sleep(max(0, float(sys.argv[2]) - time.time()))
+nexus_core.ArticleStore(sys.argv[1])
+"""
+
+def test_processes_opening_a_fresh_store_at_once(tmp_path):
+    for attempt in range(5):
+        path = str(tmp_path / f"articles{attempt}.db")
+        start = time.time() + 1.0
+        procs = [subprocess.Popen([sys.executable, "-c", OPEN_AT, path, str(start)], cwd=ROOT,
+                                  stderr=subprocess.PIPE, text=True) for _ in range(4)]
+        errors = [p.communicate(timeout=60)[1] for p in procs]
+        assert [p.returncode for p in procs] == [0] * 4, errors
+    store = core.ArticleStore(path)
+    assert store.conn.execute("SELECT COUNT(*) FROM sqlite_master WHERE name = 'articles_fts'").fetchone()[0] == 1
+
+# ── near-duplicate clustering ───────────────────────────────────
+NOW = datetime(2026, 10, 18, 12)
+STORY = "Vodafone picks Amdocs for 5G billing overhaul in Europe"
+
+def item(key, title, source, hours_ago=0, priority=False):
+    return {"id": key, "title": title, "link": f"https://example.com/{key}", "source": source,
+            "pub": NOW - timedelta(hours=hours_ago), "priority": priority, "entities": []}
+
+def clusters(store):
+    return dict(store.conn.execute("SELECT id, cluster FROM articles"))
+
+def top_for(store, key):
+    category = store.conn.execute("SELECT category FROM articles WHERE id = ?", (key,)).fetchone()[0]
+    return {row["id"]: row for row in store.top(category, NOW - timedelta(days=30))}
+
+def test_copies_from_other_outlets_collapse(tmp_path):
+    store = core.ArticleStore(str(tmp_path / "articles.db"))
+    store.ingest([
+        item("a", STORY, "Light Reading", hours_ago=5),
+        item("b", "Vodafone picks Amdocs for 5G billing overhaul in Europe - report", "Telecoms.com", hours_ago=3),
+        item("c", "Vodafone Picks Amdocs For 5G Billing Overhaul In Europe", "RCR Wireless", hours_ago=1),
+        item("d", "Netflix raises prices for ad-free streaming plans again", "Variety", hours_ago=2),
+    ])
+    assert clusters(store) == {"a": "a", "b": "a", "c": "a", "d": "d"}
+    top = top_for(store, "a")
+    assert "b" not in top and "c" not in top
+    assert top["a"]["sources"] == 2
+
+def test_same_outlet_repeats_dont_count_as_sources(tmp_path):
+    store = core.ArticleStore(str(tmp_path / "articles.db"))
+    store.ingest([item("a", STORY, "Light Reading", 2), item("b", STORY + " (updated)", "Light Reading", 1)])
+    assert clusters(store)["b"] == "a"
+    assert top_for(store, "a")["a"]["sources"] == 0
+
+def test_copy_outside_the_window_starts_its_own_cluster(tmp_path):
+    store = core.ArticleStore(str(tmp_path / "articles.db"))
+    late = core.CLUSTER_WINDOW + timedelta(hours=1)
+    store.ingest([item("old", STORY, "Light Reading", hours_ago=late.total_seconds() / 3600 + 1)])
+    store.ingest([item("new", STORY, "Telecoms.com", hours_ago=1)])
+    assert clusters(store) == {"old": "old", "new": "new"}
+
+def test_priority_copy_promotes_the_representative(tmp_path):
+    store = core.ArticleStore(str(tmp_path / "articles.db"))
+    store.ingest([item("a", STORY, "Light Reading", hours_ago=3)])
+    store.ingest([item("b", STORY + " - deal confirmed", "Telecoms.com", hours_ago=1, priority=True)])
+    assert clusters(store)["b"] == "a"
+    assert top_for(store, "a")["a"]["priority"] is True
+
+def test_store_from_before_clustering_is_clustered_on_open(tmp_path):
+    path = str(tmp_path / "articles.db")
+    conn = sqlite3.connect(path)
+    conn.executescript("""
+        CREATE TABLE articles (id TEXT PRIMARY KEY, title TEXT NOT NULL, link TEXT NOT NULL, source TEXT NOT NULL,
+            pub TEXT NOT NULL, category TEXT NOT NULL, priority INTEGER NOT NULL, entities TEXT NOT NULL,
+            ingested TEXT NOT NULL);
+        CREATE INDEX idx_articles_grid ON articles (category, priority, pub);
+    """)
+    rows = [("a", STORY, "Light Reading", 5, 0), ("b", STORY + " - report", "Telecoms.com", 3, 1),
+            ("d", "Netflix raises prices for ad-free streaming plans again", "Variety", 2, 0)]
+    conn.executemany("INSERT INTO articles VALUES (?, ?, ?, ?, ?, 'telco', ?, '[\"Amdocs\"]', ?)", [
+        (key, title, f"https://example.com/{key}", source, (NOW - timedelta(hours=h)).isoformat(), priority,
+         (NOW - timedelta(hours=h)).isoformat()) for key, title, source, h, priority in rows])
+    conn.commit()
+    conn.close()
+
+    store = core.ArticleStore(path)
+    assert clusters(store) == {"a": "a", "b": "a", "d": "d"}
+    top = {row["id"]: row for row in store.top("telco", NOW - timedelta(days=30))}
+    assert set(top) == {"a", "d"}
+    assert top["a"]["sources"] == 1 and top["a"]["priority"] is True
+    # Later copies find the migrated rows' bands
+    store.ingest([item("c", STORY, "RCR Wireless", hours_ago=1)])
+    assert clusters(store)["c"] == "a"
+    assert store.search("Vodafone")["total"] == 3
+
+def test_band_table_from_before_the_pub_column_is_upgraded(tmp_path):
+    path = str(tmp_path / "articles.db")
+    store = core.ArticleStore(path)
+    store.ingest([item("a", STORY, "Light Reading", hours_ago=3)])
+    store.conn.executescript("""
+        CREATE TABLE old_bands AS SELECT band, value, id FROM minhash_bands;
+        DROP TABLE minhash_bands;
+        ALTER TABLE old_bands RENAME TO minhash_bands;
+        CREATE INDEX idx_minhash_bands ON minhash_bands (band, value);
+    """)
+    store.conn.close()
+
+    store = core.ArticleStore(path)
+    assert {row[0] for row in store.conn.execute("SELECT DISTINCT pub FROM minhash_bands")} == {(NOW - timedelta(hours=3)).isoformat()}
+    store.ingest([item("b", STORY, "Telecoms.com", hours_ago=1)])
+    assert clusters(store)["b"] == "a"